@@ -2,9 +2,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List
 
 
+# [CHANGE] App directories. Resolved here because constants is imported once per process,
+# whereas main.py (and any Path.resolve() in it) re-executes on every rerun.
+BASE_DIR: Path = Path(__file__).resolve().parent
+DATA_DIR: Path = BASE_DIR / "data"
+
+
 # [CHANGE] Standard 5-point Likert anchors used across surveys.
 LIKERT5_ANCHORS: Dict[int, str] = {
     1: "전혀 그렇지 않다",
@@ -25,9 +32,25 @@ LIKERT5_LEGEND_HTML: str = """
 """.strip()
 
 
+# [CHANGE] Legend snippet for 6-point Likert (Achive scale only).
+LIKERT6_LEGEND_HTML: str = """
+<div style='display:flex;justify-content:center;gap:12px;flex-wrap:wrap;font-size:16px;margin-bottom:22px;'>
+  <span><b>1</b> : 전혀 그렇지 않다</span><span>—</span>
+  <span><b>3</b> : 보통이다</span><span>—</span>
+  <span><b>6</b> : 매우 그렇다</span>
+</div>
+""".strip()
+
+
 # [CHANGE] Canonical numeric options for 5-point Likert radios.
 LIKERT5_NUMERIC_OPTIONS: List[int] = [1, 2, 3, 4, 5]
 
+# [CHANGE] 1–10 difficulty scale shared by the difficulty radios.
+DIFFICULTY_RATING_OPTIONS: List[int] = list(range(1, 11))
+
+# [CHANGE] Yes/no choices for the consent radios.
+CONSENT_OPTIONS: List[str] = ["동의함", "동의하지 않음"]
+
 
 # [CHANGE] Demographic form labels and constraints.
 DEMOGRAPHIC_SEX_LABEL: str = "생물학적 성별을 선택해 주세요."
@@ -1,50 +1,60 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import hashlib
 import html
 import json
 import os
 import random
 import time
-from collections import Counter
 from dataclasses import dataclass
+from functools import partial
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import pandas as pd
 import streamlit as st
 
+try:  # Optional: faster JSON parsing for the local resource files.
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 # [CHANGE] Import centralized constants for shared UI/state configuration.
 from constants import (
     ACHIVE_DEFAULT_ITEMS,
     ANTHRO_DEFAULT_ITEMS,
+    BASE_DIR,
+    CONSENT_OPTIONS,
+    DATA_DIR,
     DEMOGRAPHIC_AGE_LABEL,
     DEMOGRAPHIC_AGE_MAX,
     DEMOGRAPHIC_AGE_MIN,
     DEMOGRAPHIC_SEX_LABEL,
     DEMOGRAPHIC_SEX_OPTIONS,
+    DIFFICULTY_RATING_OPTIONS,
     LIKERT5_LEGEND_HTML,
     LIKERT5_NUMERIC_OPTIONS,
+    LIKERT6_LEGEND_HTML,
     MANIPULATION_CHECK_EXPECTED_COUNT,
     MANIPULATION_CHECK_ITEMS,
 )
 from persistence import (
+    GCS_RESULT_STATE_KEY,
     build_sheet_row,
     build_storage_record,
     google_ready,
-    save_to_gcs,
-    save_to_sheets,
+    reset_config_cache,
+    save_all,
 )
 from utils.feedback_guard import get_feedback_once
-from utils.ui_helpers import all_answered, render_likert_numeric
+from utils.ui_helpers import all_answered, render_html, render_likert_numeric
 from utils.persistence import now_utc_iso
 
 # [CHANGE] NCS multi-session task (15 items) module.
 from tasks.ncs_task import (
     build_ncs_payload,
     compute_ncs_results,
+    NCS_PRACTICE_ITEM,
     load_ncs_items,
     render_ncs_item,
 )
@@ -262,6 +272,14 @@ COMPACT_CSS = """
      margin: 10px 0;
      overflow: hidden;
    }
+   /* render_ncs_item joins the stimulus blocks/tables into one element; restore the
+      ~1rem gap Streamlit put between them (flow-root keeps each part's own margins). */
+   .task-stimulus-part {
+     display: flow-root;
+   }
+   .task-stimulus-part + .task-stimulus-part {
+     margin-top: 1rem;
+   }
    .task-block-title {
      font-weight: 800;
      color: var(--fg);
@@ -796,12 +814,30 @@ MCP_OVERLAY_CSS = """
 </style>
 """.strip()
 
-MCP_STATUS_SEQUENCE = [
+MCP_STATUS_SEQUENCE: Tuple[Tuple[str, str], ...] = (
     ("패턴 스캔 중", "[INFO][COVNOX] Parsing rationale tags (single-select)"),
     ("응답 일치도 정렬 중", "추론 근거 태그 분포를 규칙 템플릿과 비교하는 중입니다."),
     ("추론 효율 계산 중", "조건별 비교 지표와 안정도를 재계산하고 있습니다."),
     ("AI 튜터 리포트 구성 중", "맞춤형 메시지를 정교화하고 있습니다."),
-]
+)
+MCP_STATUS_COUNT = len(MCP_STATUS_SEQUENCE)
+
+# [CHANGE] Single source for the per-session titles used by the task, overlay and feedback.
+NCS_SESSION_LABELS: Dict[int, str] = {
+    1: "문제 해결 과제 · 세션 1",
+    2: "문제 해결 과제 · 세션 2",
+    3: "문제 해결 과제 · 세션 3",
+}
+
+MCP_ROUND_LABELS: Dict[str, str] = {
+    f"session{n}": NCS_SESSION_LABELS[n] for n in (1, 2)
+}
+
+# Cycled "..." suffix for the status headline, one entry per animation frame.
+MCP_DOT_FRAMES = (".", "..", "...")
+
+# Interval between MCP overlay frames; each frame is one fragment rerun.
+MCP_TICK_SECONDS = 0.25
 
 MCP_OVERLAY_TEMPLATE = """
 <div class="mcp-overlay">
@@ -997,21 +1033,22 @@ ANALYSIS_COMPLETE_CSS = """
 """.strip()
 
 
-# [CHANGE] Legend snippet for 6-point Likert (Achive scale only).
-LIKERT6_LEGEND_HTML = """
-<div style='display:flex;justify-content:center;gap:12px;flex-wrap:wrap;font-size:16px;margin-bottom:22px;'>
-  <span><b>1</b> : 전혀 그렇지 않다</span><span>—</span>
-  <span><b>3</b> : 보통이다</span><span>—</span>
-  <span><b>6</b> : 매우 그렇다</span>
-</div>
-""".strip()
-
 # [CHANGE] Default runtime feature toggles for feedback/debug rendering.
 SHOW_PER_ITEM_INLINE_FEEDBACK = False
 SHOW_PER_ITEM_SUMMARY = False
 SHOW_DEBUG_RESULTS = False
 
 
+# The 2×2 feedback conditions. Kept server-side in session_state only: putting the
+# assignment in the URL (query params) would expose it to participants.
+FEEDBACK_CONDITIONS: Tuple[str, ...] = (
+    "emotional_specific",
+    "analytical_specific",
+    "emotional_superficial",
+    "analytical_superficial",
+)
+
+
 def get_or_assign_feedback_condition() -> str:
     """
     Randomly assign ONE feedback condition per participant and persist it.
@@ -1040,14 +1077,7 @@ def get_or_assign_feedback_condition() -> str:
         return str(st.session_state[key])
 
     # Fresh assignment (4 total conditions).
-    st.session_state[key] = random.choice(
-        [
-            "emotional_specific",
-            "analytical_specific",
-            "emotional_superficial",
-            "analytical_superficial",
-        ]
-    )
+    st.session_state[key] = random.choice(FEEDBACK_CONDITIONS)
     st.session_state["praise_condition"] = st.session_state[key]  # legacy alias
     return str(st.session_state[key])
 
@@ -1124,45 +1154,33 @@ def typewriter_markdown(
     container: Optional["st.delta_generator.DeltaGenerator"] = None,
     wrapper_class: Optional[str] = None,
 ) -> None:
-    try:
-        if container is not None:
-            holder = container.empty()
-            buffer = ""
-            for ch in md:
-                buffer += ch
-                rendered = buffer.replace("\n", "<br />")
-                if wrapper_class:
-                    holder.markdown(
-                        f'<div class="{wrapper_class}">{rendered}</div>',
-                        unsafe_allow_html=True,
-                    )
-                else:
-                    holder.markdown(rendered.replace("<br />", "  \n"))
-                time.sleep(speed)
-            return
-        with st.chat_message("assistant"):
-            holder = st.empty()
-            buffer = ""
-            for ch in md:
-                buffer += ch
-                holder.markdown(buffer.replace("\n", "  \n"))
-                time.sleep(speed)
-    except Exception:
-        fallback_container = container if container is not None else st.container()
-        holder = fallback_container.empty()
-        buffer = ""
+    # [CHANGE] Newlines are translated as each character is appended, so a frame costs
+    # one append instead of re-running .replace() over the whole prefix.
+    def _type_into(holder: Any, newline: str, *, wrap: bool) -> None:
+        rendered = ""
         for ch in md:
-            buffer += ch
-            rendered = buffer.replace("\n", "<br />")
-            if wrapper_class:
+            rendered += newline if ch == "\n" else ch
+            if wrap:
                 holder.markdown(
                     f'<div class="{wrapper_class}">{rendered}</div>',
                     unsafe_allow_html=True,
                 )
             else:
-                holder.markdown(rendered.replace("<br />", "  \n"))
+                holder.markdown(rendered)
             time.sleep(speed)
 
+    wrap = bool(wrapper_class)
+    newline = "<br />" if wrap else "  \n"
+    try:
+        if container is not None:
+            _type_into(container.empty(), newline, wrap=wrap)
+            return
+        with st.chat_message("assistant"):
+            _type_into(st.empty(), "  \n", wrap=False)
+    except Exception:
+        fallback_container = container if container is not None else st.container()
+        _type_into(fallback_container.empty(), newline, wrap=wrap)
+
 
 def apply_praise_highlights(text: str, extra_terms: Optional[List[str]] = None) -> str:
     # Highlighting is intentionally disabled (kept for styling compatibility).
@@ -1173,11 +1191,23 @@ def typewriter(text: str, speed: float = 0.01) -> None:
     holder = st.empty()
     output = ""
     for ch in text:
-        output += ch
-        holder.markdown(output.replace("\n", "  \n"))
+        output += "  \n" if ch == "\n" else ch
+        holder.markdown(output)
         time.sleep(speed)
 
 
+PRAISE_CARD_TEMPLATE = (
+    '<div class="feedback-card feedback-praise-card"{empty_attr}>'
+    '<div class="feedback-praise-text">{body}</div>'
+    "</div>"
+)
+PRAISE_CARD_FALLBACK_TEXT = "피드백 메시지를 불러오지 못했습니다. 잠시 후 다시 시도해 주세요."
+
+
+def _praise_text_html(text: str) -> str:
+    return html.escape(text).replace("\n", "<br />")
+
+
 def render_praise_card_with_typewriter(
     text: str,
     *,
@@ -1197,40 +1227,41 @@ def render_praise_card_with_typewriter(
     has_text = bool(raw_text.strip())
     cache_key = f"{round_key}_praise_card_text"
     typed_flag_key = f"{round_key}_praise_card_typed"
+    html_key = f"{round_key}_praise_card_html"
 
-    def render_card(content: str, *, mark_empty: bool = False) -> None:
-        display_text = (
-            content
-            if content
-            else "피드백 메시지를 불러오지 못했습니다. 잠시 후 다시 시도해 주세요."
-        )
-        safe_text = html.escape(display_text).replace("\n", "<br />")
+    def render_card(body_html: str, *, mark_empty: bool = False) -> None:
         empty_attr = ' data-empty="true"' if mark_empty else ""
         target.markdown(
-            f'<div class="feedback-card feedback-praise-card"{empty_attr}>'
-            f'<div class="feedback-praise-text">{safe_text}</div>'
-            "</div>",
+            PRAISE_CARD_TEMPLATE.format(empty_attr=empty_attr, body=body_html),
             unsafe_allow_html=True,
         )
 
     if not has_text:
-        render_card("", mark_empty=True)
+        render_card(_praise_text_html(PRAISE_CARD_FALLBACK_TEXT), mark_empty=True)
         return
 
     if st.session_state.get(cache_key) != raw_text:
         st.session_state[cache_key] = raw_text
         st.session_state[typed_flag_key] = False
+        st.session_state.pop(html_key, None)
 
+    # [CHANGE] Reuse the escaped card body on reruns instead of rebuilding it.
     if st.session_state.get(typed_flag_key):
-        render_card(raw_text)
+        body_html = st.session_state.get(html_key)
+        if body_html is None:
+            body_html = st.session_state[html_key] = _praise_text_html(raw_text)
+        render_card(body_html)
         return
 
+    # Escaping is per character, so escape each glyph once and grow the body by
+    # appending instead of re-escaping the whole prefix on every frame.
     buffer = ""
     for ch in raw_text:
-        buffer += ch
+        buffer += _praise_text_html(ch)
         render_card(buffer)
         time.sleep(speed)
 
+    st.session_state[html_key] = buffer
     st.session_state[typed_flag_key] = True
 
 
@@ -1245,6 +1276,17 @@ def run_once(key: str, fn, *args, **kwargs):
 # NCS-style tasks do not collect or request rationale selections.
 
 
+CONDITION_ALIASES: Dict[str, str] = {
+    # Legacy naming → canonical naming
+    "computational_specific": "analytical_specific",
+    "computational_surface": "analytical_superficial",
+    "computational_superficial": "analytical_superficial",
+    "emotional_surface": "emotional_superficial",
+    # Canonical (idempotent)
+    **{condition: condition for condition in FEEDBACK_CONDITIONS},
+}
+
+
 def normalize_condition(value: Optional[str]) -> str:
     """
     Normalize feedback condition labels to the 4 canonical experiment conditions:
@@ -1256,21 +1298,9 @@ def normalize_condition(value: Optional[str]) -> str:
     Backward-compatibility: older labels like 'computational_*' and '*_surface'
     are mapped into the canonical set.
     """
-    mapping = {
-        # Legacy naming → canonical naming
-        "computational_specific": "analytical_specific",
-        "computational_surface": "analytical_superficial",
-        "computational_superficial": "analytical_superficial",
-        "emotional_surface": "emotional_superficial",
-        # Canonical (idempotent)
-        "emotional_specific": "emotional_specific",
-        "analytical_specific": "analytical_specific",
-        "emotional_superficial": "emotional_superficial",
-        "analytical_superficial": "analytical_superficial",
-    }
     if not value:
         return "emotional_superficial"
-    return mapping.get(str(value), str(value))
+    return CONDITION_ALIASES.get(str(value), str(value))
 
 
 def _condition_to_feedback_key(condition: str) -> str:
@@ -1313,8 +1343,6 @@ def generate_session_feedback(session_id: int, context: Dict[str, Any]) -> Dict[
     }
 
 
-BASE_DIR = Path(__file__).resolve().parent
-
 # [CHANGE] Limit inference answer exports to the first 10 items for wide format.
 INFERENCE_EXPORT_COUNT = 10
 
@@ -1388,187 +1416,6 @@ class ExperimentData:
     completion_time: float
 
 
-NOUN_QUESTIONS: List[Question] = [
-    # Visual inference block 1: time of day (shadow length cues)
-    # Note (internal): All figures are non-realistic silhouettes with no facial/identity cues.
-    Question(
-        id="N1",
-        gloss="이미지를 주의 깊게 관찰하세요.",
-        stem="이미지를 바탕으로, 하루 중 어느 시간대일 가능성이 가장 높나요?",
-        options=[
-            "A. 이른 아침",
-            "B. 늦은 아침",
-            "C. 정오 무렵",
-            "D. 늦은 오후",
-        ],
-        answer_idx=0,
-        reason_idx=0,
-        image_path=str(BASE_DIR / "time_task_1.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="N2",
-        gloss="이미지를 주의 깊게 관찰하세요.",
-        stem="이미지를 바탕으로, 하루 중 어느 시간대일 가능성이 가장 높나요?",
-        options=[
-            "A. 이른 아침",
-            "B. 늦은 아침",
-            "C. 정오 무렵",
-            "D. 늦은 오후",
-        ],
-        answer_idx=1,
-        reason_idx=2,
-        image_path=str(BASE_DIR / "time_task_2.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="N3",
-        gloss="이미지를 주의 깊게 관찰하세요.",
-        stem="이미지를 바탕으로, 하루 중 어느 시간대일 가능성이 가장 높나요?",
-        options=[
-            "A. 이른 아침",
-            "B. 늦은 아침",
-            "C. 정오 무렵",
-            "D. 늦은 오후",
-        ],
-        answer_idx=2,
-        reason_idx=1,
-        image_path=str(BASE_DIR / "time_task_3.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="N4",
-        gloss="이미지를 주의 깊게 관찰하세요.",
-        stem="이미지를 바탕으로, 하루 중 어느 시간대일 가능성이 가장 높나요?",
-        options=[
-            "A. 이른 아침",
-            "B. 늦은 아침",
-            "C. 정오 무렵",
-            "D. 늦은 오후",
-        ],
-        answer_idx=3,
-        reason_idx=2,
-        image_path=str(BASE_DIR / "time_task_4.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="N5",
-        gloss="이미지를 주의 깊게 관찰하세요.",
-        stem="이미지를 바탕으로, 하루 중 어느 시간대일 가능성이 가장 높나요?",
-        options=[
-            "A. 이른 아침",
-            "B. 늦은 아침",
-            "C. 정오 무렵",
-            "D. 늦은 오후",
-        ],
-        answer_idx=3,
-        reason_idx=0,
-        image_path=str(BASE_DIR / "time_task_5.png"),
-        shuffle_options=False,
-    ),
-]
-
-VERB_QUESTIONS: List[Question] = [
-    # Visual inference block 2: time_task2 (panel-based earliest-time inference)
-    Question(
-        id="V1",
-        gloss=(
-            "아래 그림은 비슷한 시간대의 서로 다른 장면을 보여줍니다.\n"
-            "각 장면에는 그림자와 빛의 방향, 밝기 등에 미세한 차이가 있습니다.\n\n"
-            "세 장면(A, B, C) 중\n"
-            "가장 이른 시간의 장면을 하나 선택해 주세요."
-        ),
-        stem="다음 그림 중 시간이 가장 이른 장면은 무엇입니까?",
-        options=[
-            "A",
-            "B",
-            "C",
-        ],
-        answer_idx=0,
-        reason_idx=0,
-        image_path=str(BASE_DIR / "time_task2_1.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="V2",
-        gloss=(
-            "아래 그림은 비슷한 시간대의 서로 다른 장면을 보여줍니다.\n"
-            "각 장면에는 그림자와 빛의 방향, 밝기 등에 미세한 차이가 있습니다.\n\n"
-            "세 장면(A, B, C) 중\n"
-            "가장 이른 시간의 장면을 하나 선택해 주세요."
-        ),
-        stem="다음 그림 중 시간이 가장 이른 장면은 무엇입니까?",
-        options=[
-            "A",
-            "B",
-            "C",
-        ],
-        answer_idx=0,
-        reason_idx=0,
-        image_path=str(BASE_DIR / "time_task2_2.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="V3",
-        gloss=(
-            "아래 그림은 비슷한 시간대의 서로 다른 장면을 보여줍니다.\n"
-            "각 장면에는 그림자와 빛의 방향, 밝기 등에 미세한 차이가 있습니다.\n\n"
-            "세 장면(A, B, C) 중\n"
-            "가장 이른 시간의 장면을 하나 선택해 주세요."
-        ),
-        stem="다음 그림 중 시간이 가장 이른 장면은 무엇입니까?",
-        options=[
-            "A",
-            "B",
-            "C",
-        ],
-        answer_idx=0,
-        reason_idx=0,
-        image_path=str(BASE_DIR / "time_task2_3.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="V4",
-        gloss=(
-            "아래 그림은 비슷한 시간대의 서로 다른 장면을 보여줍니다.\n"
-            "각 장면에는 그림자와 빛의 방향, 밝기 등에 미세한 차이가 있습니다.\n\n"
-            "세 장면(A, B, C) 중\n"
-            "가장 이른 시간의 장면을 하나 선택해 주세요."
-        ),
-        stem="다음 그림 중 시간이 가장 이른 장면은 무엇입니까?",
-        options=[
-            "A",
-            "B",
-            "C",
-        ],
-        answer_idx=0,
-        reason_idx=0,
-        image_path=str(BASE_DIR / "time_task2_4.png"),
-        shuffle_options=False,
-    ),
-    Question(
-        id="V5",
-        gloss=(
-            "아래 그림은 비슷한 시간대의 서로 다른 장면을 보여줍니다.\n"
-            "각 장면에는 그림자와 빛의 방향, 밝기 등에 미세한 차이가 있습니다.\n\n"
-            "세 장면(A, B, C) 중\n"
-            "가장 이른 시간의 장면을 하나 선택해 주세요."
-        ),
-        stem="다음 그림 중 시간이 가장 이른 장면은 무엇입니까?",
-        options=[
-            "A",
-            "B",
-            "C",
-        ],
-        answer_idx=0,
-        reason_idx=0,
-        image_path=str(BASE_DIR / "time_task2_5.png"),
-        shuffle_options=False,
-    ),
-]
-
-ALL_INFERENCE_QUESTIONS = NOUN_QUESTIONS + VERB_QUESTIONS
-
 # --------------------------------------------------------------------------------------
 # NCS multi-session task (15 items, 3 sessions × 5):
 # - Session 1: Q1–Q5  → MCP animation → Feedback (once)
@@ -1576,11 +1423,25 @@ ALL_INFERENCE_QUESTIONS = NOUN_QUESTIONS + VERB_QUESTIONS
 # - Session 3: Q11–Q15 → No feedback → Transition → Motivation & manipulation check
 # --------------------------------------------------------------------------------------
 
-NCS_ITEMS: List[Dict[str, Any]] = load_ncs_items()
+
+# Built once per process: main.py re-executes on every rerun, and load_ncs_items() rebuilds
+# all 15 item dicts and re-runs the authoring-placeholder scan each time. Items are treated
+# as read-only (callers copy before use), so sharing one instance across sessions is safe.
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_ncs_items_cached() -> List[Dict[str, Any]]:
+    return load_ncs_items()
+
+
+NCS_ITEMS: List[Dict[str, Any]] = _load_ncs_items_cached()
 NCS_TOTAL_ITEMS: int = len(NCS_ITEMS)
 NCS_SESSION1_ITEMS: List[Dict[str, Any]] = NCS_ITEMS[:5]
 NCS_SESSION2_ITEMS: List[Dict[str, Any]] = NCS_ITEMS[5:10]
 NCS_SESSION3_ITEMS: List[Dict[str, Any]] = NCS_ITEMS[10:]
+NCS_SESSION_ITEMS: Dict[int, List[Dict[str, Any]]] = {
+    1: NCS_SESSION1_ITEMS,
+    2: NCS_SESSION2_ITEMS,
+    3: NCS_SESSION3_ITEMS,
+}
 
 MOTIVATION_QUESTIONS: List[SurveyQuestion] = [
     # =========================================================
@@ -1657,6 +1518,16 @@ MOTIVATION_BY_ID = {q.id: q for q in MOTIVATION_QUESTIONS}
 # --------------------------------------------------------------------------------------
 
 
+def _epoch_to_iso(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value).isoformat()
+    return value
+
+
+def _with_iso_timestamps(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{**entry, "timestamp": _epoch_to_iso(entry.get("timestamp"))} for entry in entries]
+
+
 class ExperimentManager:
     def __init__(self) -> None:
         self.current_participant: Optional[Dict[str, Any]] = None
@@ -1667,7 +1538,7 @@ class ExperimentManager:
         assigned_condition: Optional[str] = None,
     ) -> str:
         participant_id = (
-            f"P_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{random.randint(1000, 9999)}"
+            f"P_{time.strftime('%Y%m%d_%H%M%S')}_{random.randint(1000, 9999)}"
         )
         condition = (
             normalize_condition(assigned_condition)
@@ -1679,6 +1550,8 @@ class ExperimentManager:
             "condition": condition,
             "demographic": demographic_data,
             "start_time": time.time(),
+            # Elapsed time is measured on the monotonic clock (immune to wall-clock jumps).
+            "start_monotonic": time.monotonic(),
             "inference_responses": [],
             "survey_responses": [],
             "feedback_messages": [],
@@ -1699,7 +1572,8 @@ class ExperimentManager:
             "selected_option": selected_option,
             "selected_reason": selected_reason,
             "response_time": response_time,
-            "timestamp": datetime.now().isoformat(),
+            # Epoch seconds; converted to ISO once in complete_experiment().
+            "timestamp": time.time(),
         }
         self.current_participant["inference_responses"].append(record)
         return selected_reason
@@ -1711,26 +1585,35 @@ class ExperimentManager:
             {
                 "question_id": question_id,
                 "rating": rating,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.time(),
             }
         )
 
     def complete_experiment(self) -> ExperimentData:
         if not self.current_participant:
             raise ValueError("참가자 정보가 초기화되지 않았습니다.")
-        completion_time = time.time() - self.current_participant["start_time"]
+        end_time = time.time()
+        start = self.current_participant.get("start_monotonic")
+        if start is None:
+            # Participant started before start_monotonic was recorded (e.g. a session
+            # that survived a redeploy): fall back to the wall-clock start.
+            completion_time = end_time - self.current_participant["start_time"]
+        else:
+            completion_time = time.monotonic() - start
         data = ExperimentData(
             participant_id=self.current_participant["id"],
             condition=self.current_participant["condition"],
             demographic=self.current_participant["demographic"],
-            inference_responses=self.current_participant["inference_responses"],
-            survey_responses=self.current_participant["survey_responses"],
+            inference_responses=_with_iso_timestamps(
+                self.current_participant["inference_responses"]
+            ),
+            survey_responses=_with_iso_timestamps(
+                self.current_participant["survey_responses"]
+            ),
             feedback_messages=self.current_participant["feedback_messages"],
             timestamps={
-                "start": datetime.fromtimestamp(
-                    self.current_participant["start_time"]
-                ).isoformat(),
-                "end": datetime.now().isoformat(),
+                "start": _epoch_to_iso(self.current_participant["start_time"]),
+                "end": _epoch_to_iso(end_time),
             },
             completion_time=completion_time,
         )
@@ -2033,39 +1916,56 @@ def inject_covx_toggle(round_no: int) -> None:
     )
 
 
+def _mcp_overlay_html(round_label: str, step: int, steps: int) -> str:
+    progress = int(step / steps * 100)
+    ratio = progress / 100 if steps > 0 else 0
+    status_index = min(MCP_STATUS_COUNT - 1, int(ratio * MCP_STATUS_COUNT))
+    status_headline, status_detail = MCP_STATUS_SEQUENCE[status_index]
+    if step == steps:
+        status_headline = "AI 분석 완료"
+        status_detail = "결과 요약을 준비하고 있습니다."
+    return MCP_OVERLAY_TEMPLATE.format(
+        round_label=round_label,
+        status_headline=status_headline,
+        status_detail=status_detail,
+        dots=MCP_DOT_FRAMES[step % len(MCP_DOT_FRAMES)],
+        progress=progress,
+    )
+
+
+# [CHANGE] The overlay is fully determined by (round label, frame count), so build the
+# whole frame sequence once per process and let each tick just index into it.
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _mcp_overlay_frames(round_label: str, steps: int) -> Tuple[str, ...]:
+    return tuple(_mcp_overlay_html(round_label, step, steps) for step in range(steps + 1))
+
+
+@st.fragment(run_every=MCP_TICK_SECONDS)
+def _mcp_animation_tick(round_key: str, round_no: int, steps: int) -> None:
+    """
+    Draw one overlay frame per fragment run.
+
+    Only this fragment re-executes on each tick, so the script thread is never parked in
+    time.sleep() and the rest of the page is not rebuilt. Once the last frame has been
+    shown the round is marked done and a single app rerun renders the completion card.
+    """
+    step_registry: Dict[int, int] = st.session_state.setdefault("mcp_step", {})
+    step = step_registry.get(round_no, 0)
+    if step > steps:
+        step_registry.pop(round_no, None)
+        st.session_state.setdefault("mcp_done", {})[round_no] = True
+        st.rerun()
+    round_label = MCP_ROUND_LABELS.get(round_key, "문제 해결 과제")
+    render_html(_mcp_overlay_frames(round_label, steps)[step])
+    step_registry[round_no] = step + 1
+
+
 def render_mcp_animation(round_key: str, round_no: int, seconds: float = 2.5) -> None:
     """Render a full-screen MCP overlay animation that blocks background interactions."""
     st.session_state["in_mcp"] = True
     st.markdown(MCP_OVERLAY_CSS, unsafe_allow_html=True)
-    placeholder = st.empty()
-
-    steps = max(1, int(seconds * 20))
-    round_label_map = {
-        "session1": "문제 해결 과제 · 세션 1",
-        "session2": "문제 해결 과제 · 세션 2",
-    }
-    round_label = round_label_map.get(round_key, "문제 해결 과제")
-
-    for step in range(steps + 1):
-        progress = int(step / steps * 100)
-        ratio = progress / 100 if steps > 0 else 0
-        status_index = min(
-            len(MCP_STATUS_SEQUENCE) - 1, int(ratio * len(MCP_STATUS_SEQUENCE))
-        )
-        status_headline, status_detail = MCP_STATUS_SEQUENCE[status_index]
-        if step == steps:
-            status_headline = "AI 분석 완료"
-            status_detail = "결과 요약을 준비하고 있습니다."
-        dots = "." * ((step % 3) + 1)
-        html = MCP_OVERLAY_TEMPLATE.format(
-            round_label=round_label,
-            status_headline=status_headline,
-            status_detail=status_detail,
-            dots=dots,
-            progress=progress,
-        )
-        placeholder.markdown(html, unsafe_allow_html=True)
-        time.sleep(seconds / steps)
+    steps = max(1, int(seconds / MCP_TICK_SECONDS))
+    _mcp_animation_tick(round_key, round_no, steps)
 
 
 def export_session_json(payload: Dict[str, Any]) -> None:
@@ -2152,6 +2052,8 @@ def ensure_session_state() -> None:
         ss.save_error = None
     if "save_destination" not in ss:
         ss.save_destination = None
+    if GCS_RESULT_STATE_KEY not in ss:
+        ss[GCS_RESULT_STATE_KEY] = None
     if "motivation_page" not in ss:
         ss.motivation_page = 1
     if "anthro_page" not in ss:
@@ -2217,6 +2119,25 @@ RESOURCE_FALLBACKS: Dict[str, List[str]] = {
     "questions_achive.json": ACHIVE_DEFAULT_ITEMS,
 }
 
+# Resolved once at import so phase renders don't rebuild the same paths per rerun.
+# Stored as str: that is what os.path and the _read_json_file cache key want.
+RESOURCE_PATHS: Dict[str, str] = {
+    filename: str(DATA_DIR / filename) for filename in RESOURCE_FALLBACKS
+}
+
+
+# Bound every Streamlit cache so long-running deployments don't accumulate entries.
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+@st.cache_data(max_entries=8, ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _read_json_file(path: str, mtime_ns: int = 0) -> Any:
+    # mtime_ns is only part of the cache key: editing a data file invalidates its entry.
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
 
 def _warn_resource_fallback(filename: str) -> None:
     registry = st.session_state.setdefault("_resource_fallback_warned", {})
@@ -2227,11 +2148,14 @@ def _warn_resource_fallback(filename: str) -> None:
 
 def _load_local_json(filename: str) -> Optional[List[str]]:
     fallback = RESOURCE_FALLBACKS.get(filename)
-    path = BASE_DIR / "data" / filename
-    if path.exists():
+    path = RESOURCE_PATHS.get(filename) or str(DATA_DIR / filename)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
         try:
-            with path.open("r", encoding="utf-8") as file_obj:
-                data = json.load(file_obj)
+            data = _read_json_file(path, mtime_ns)
         except Exception:
             if fallback:
                 _warn_resource_fallback(filename)
@@ -2255,37 +2179,49 @@ def _load_local_json(filename: str) -> Optional[List[str]]:
 # --------------------------------------------------------------------------------------
 # Rendering helpers for each phase
 # --------------------------------------------------------------------------------------
+# [CHANGE] Switch consent steps in a button callback: the click's own rerun already
+# renders the new step, so no follow-up st.rerun() is needed.
+def _set_consent_step(step: str) -> None:
+    st.session_state.consent_step = step
+
+
 def render_consent() -> None:
     scroll_top_js()
     st.markdown(COMMON_CSS, unsafe_allow_html=True)
     if st.session_state.consent_step == "explain":
         st.title("연구 소개")
         st.markdown(CONSENT_HTML, unsafe_allow_html=True)
-        if st.button("다음", use_container_width=True):
-            st.session_state.consent_step = "agree"
-            st.rerun()
+        st.button(
+            "다음",
+            use_container_width=True,
+            on_click=_set_consent_step,
+            args=("agree",),
+        )
         return
 
     st.title("연구 동의 및 개인정보 동의")
     st.markdown(AGREE_HTML, unsafe_allow_html=True)
     consent_research = st.radio(
         "연구 참여에 동의하십니까?",
-        ["동의함", "동의하지 않음"],
+        CONSENT_OPTIONS,
         horizontal=True,
         key="consent_research_radio",
     )
     st.markdown(PRIVACY_HTML, unsafe_allow_html=True)
     consent_privacy = st.radio(
         "개인정보 수집·이용에 동의하십니까?",
-        ["동의함", "동의하지 않음"],
+        CONSENT_OPTIONS,
         horizontal=True,
         key="consent_privacy_radio",
     )
     cols = st.columns(2)
     with cols[0]:
-        if st.button("이전", use_container_width=True):
-            st.session_state.consent_step = "explain"
-            st.rerun()
+        st.button(
+            "이전",
+            use_container_width=True,
+            on_click=_set_consent_step,
+            args=("explain",),
+        )
     with cols[1]:
         if st.button("동의하고 진행", use_container_width=True):
             if consent_research != "동의함" or consent_privacy != "동의함":
@@ -2303,7 +2239,13 @@ def render_demographic() -> None:
     scroll_top_js()
     st.title("인적사항 입력")
     st.write("연구 통계와 조건 배정을 위해 아래 정보를 입력해 주세요.")
+    _render_demographic_inputs()
+
 
+# [CHANGE] Fragment: typing the age or picking a sex reruns only these inputs, not the
+# whole app; "다음 단계" leaves through set_phase(), which triggers a full app rerun.
+@st.fragment
+def _render_demographic_inputs() -> None:
     # [CHANGE] Enforce required biological sex selection without defaults.
     sex_value, sex_valid = radio_required(
         DEMOGRAPHIC_SEX_LABEL, DEMOGRAPHIC_SEX_OPTIONS, key="demographic_sex"
@@ -2416,66 +2358,65 @@ def render_paginated_likert(
     if not st.session_state.payload.get(responses_key):
         st.session_state.payload[responses_key] = [None] * total
 
-    st.markdown(prompt_html, unsafe_allow_html=True)
-    st.markdown(scale_hint_html, unsafe_allow_html=True)
-    st.markdown(
-        f"<div style='text-align:center;color:#6b7480;margin-bottom:12px;'>문항 {start_idx + 1}–{end_idx} / {total} (페이지 {page}/{total_pages})</div>",
-        unsafe_allow_html=True,
+    render_html(prompt_html)
+    render_html(scale_hint_html)
+    render_html(
+        f"<div style='text-align:center;color:#6b7480;margin-bottom:12px;'>문항 {start_idx + 1}–{end_idx} / {total} (페이지 {page}/{total_pages})</div>"
     )
 
-    options = list(range(scale_min, scale_max + 1))
-    for idx in range(start_idx, end_idx):
-        label = questions[idx]
-        question_id = (
-            question_ids[idx] if question_ids and idx < len(question_ids) else str(idx)
-        )
-        selected = render_likert_numeric(
-            item_id=f"{key_prefix}_{question_id}",
-            label=f"{idx + 1}. {label}",
-            options=options,
-            key_prefix=f"{key_prefix}_opt",
-        )
-        value_key = f"{key_prefix}_val_{idx}"
-        if selected is None:
-            st.session_state[value_key] = None
-            st.session_state.payload[responses_key][idx] = None
-        else:
-            st.session_state[value_key] = int(selected)
-            st.session_state.payload[responses_key][idx] = int(selected)
-
-    page_values = [
-        st.session_state.get(f"{key_prefix}_val_{idx}")
-        for idx in range(start_idx, end_idx)
-    ]
-
-    col_prev, col_next = st.columns(2)
-    with col_prev:
-        if page > 1 and st.button(
-            "← 이전", use_container_width=True, key=f"{key_prefix}_prev"
-        ):
-            st.session_state[page_state_key] = page - 1
-            set_phase(st.session_state.phase)
-    with col_next:
-        next_label = "다음 단계" if page == total_pages else "다음 →"
-        if st.button(next_label, use_container_width=True, key=f"{key_prefix}_next"):
-            if any(v is None for v in page_values):
-                st.warning("현재 페이지의 모든 문항에 응답해 주세요.")
+    # [CHANGE] Batch the page's radios into a form so answers only rerun on submit.
+    with st.form(f"{key_prefix}_form_{page}", border=False):
+        options = list(range(scale_min, scale_max + 1))
+        for idx in range(start_idx, end_idx):
+            label = questions[idx]
+            question_id = (
+                question_ids[idx] if question_ids and idx < len(question_ids) else str(idx)
+            )
+            selected = render_likert_numeric(
+                item_id=f"{key_prefix}_{question_id}",
+                label=f"{idx + 1}. {label}",
+                options=options,
+                key_prefix=f"{key_prefix}_opt",
+            )
+            value_key = f"{key_prefix}_val_{idx}"
+            if selected is None:
+                st.session_state[value_key] = None
+                st.session_state.payload[responses_key][idx] = None
             else:
-                if page == total_pages:
-                    all_values = [
-                        st.session_state.get(f"{key_prefix}_val_{idx}")
-                        for idx in range(total)
-                    ]
-                    if any(v is None for v in all_values):
-                        st.warning("모든 문항에 응답해 주세요.")
-                    else:
-                        st.session_state.payload[responses_key] = [
-                            int(v) for v in all_values
-                        ]
-                        return True
+                st.session_state[value_key] = int(selected)
+                st.session_state.payload[responses_key][idx] = int(selected)
+
+        page_values = [
+            st.session_state.get(f"{key_prefix}_val_{idx}")
+            for idx in range(start_idx, end_idx)
+        ]
+
+        col_prev, col_next = st.columns(2)
+        with col_prev:
+            if page > 1 and st.form_submit_button("← 이전", use_container_width=True):
+                st.session_state[page_state_key] = page - 1
+                set_phase(st.session_state.phase)
+        with col_next:
+            next_label = "다음 단계" if page == total_pages else "다음 →"
+            if st.form_submit_button(next_label, use_container_width=True):
+                if None in page_values:
+                    st.warning("현재 페이지의 모든 문항에 응답해 주세요.")
                 else:
-                    st.session_state[page_state_key] = page + 1
-                    set_phase(st.session_state.phase)
+                    if page == total_pages:
+                        all_values = [
+                            st.session_state.get(f"{key_prefix}_val_{idx}")
+                            for idx in range(total)
+                        ]
+                        if None in all_values:
+                            st.warning("모든 문항에 응답해 주세요.")
+                        else:
+                            st.session_state.payload[responses_key] = [
+                                int(v) for v in all_values
+                            ]
+                            return True
+                    else:
+                        st.session_state[page_state_key] = page + 1
+                        set_phase(st.session_state.phase)
     return False
 
 
@@ -2647,77 +2588,55 @@ def render_practice_building_height() -> None:
             set_phase("ncs_session1")
         return
 
-    # Very easy NCS-style practice item (short; similar length to main items).
-    practice_item: Dict[str, Any] = {
-        "id": "ncs_practice_q1",
-        "item_number": 0,
-        "session_id": 0,
-        "domain": "practice",
-        "instruction": "사수가 자리를 비워 혼자 업무를 보던 중, 메일 한 통이 도착했다.\n 받은 메일 제목: [!긴급!] A시스템에 심각한 오류가 발견되었습니다. 확인 후 회신 바랍니다.",
-        "stimulus_type": "text",
-        "stimulus_text": "",
-        "info_blocks": [{"title": "", "bullets": ["모든 메시지의 연락은 사수의 컨펌을 받은 후 회신 해야한다.",
-        " 단, 사수 부재시 개별 판단이 가능하다."]}],
-        "table_spec": {},
-        "question": "다음 중 가장 적절한 행동은 무엇인가?",
-        "options": {
-            "1": "즉시 메일에 답장한다.",
-            "2": "사수에게 보고하고 후속 조치를 기다린다.",
-            "3": "사수에게 해당 메일을 포워딩한다.",
-            "4": "내용 확인 후 대기한다.",
-            "5": "시스템 문제를 내가 해결한다.",
-        },
-        "answer_key": "1",
-    }
+    practice_item = NCS_PRACTICE_ITEM
 
-    selected_key, _unused_rationales, meta = render_ncs_item(
+    _selected_key, _unused_rationales, meta = render_ncs_item(
         item=practice_item, item_index=0, total_items=1
     )
     answer_valid = bool(meta.get("answer_valid"))
+    answer_state_key = f"ncs_{practice_item['id']}_answer"
 
-    submitted = st.button(
+    def _on_submit_practice() -> None:
+        # Runs before the script on the click rerun, so the completion screen above
+        # renders in that same pass without a second st.rerun().
+        selected_raw = st.session_state.get(answer_state_key)
+        selected = str(selected_raw) if selected_raw is not None else None
+        options_dict: Dict[str, str] = dict(practice_item.get("options") or {})
+        if not selected or selected not in options_dict:
+            return
+        correct_key = str(practice_item.get("answer_key") or "")
+        is_correct = bool(correct_key and selected == correct_key)
+
+        practice_record: Dict[str, Any] = {
+            "question_id": str(practice_item.get("id") or ""),
+            "stimulus_image": "",
+            "options": [f"{k}) {v}" for k, v in options_dict.items()],
+            "selected_option": int(selected) - 1,
+            "selected_option_text": options_dict.get(selected, ""),
+            "selected_option_code": selected,
+            "correct_idx": int(correct_key) - 1 if correct_key else "",
+            "correct_option_code": correct_key,
+            "is_correct": bool(is_correct),
+            # Rationale selection is removed for NCS tasks.
+            "selected_reason_text": "",
+            "selected_reason_code": "",
+            "timestamp": now_utc_iso(),
+        }
+
+        st.session_state.practice_state = {
+            "attempted": True,
+            "correct": bool(is_correct),
+            "record": practice_record,
+        }
+        st.session_state.payload["practice_attempt"] = practice_record
+
+    st.button(
         "제출하기",
         use_container_width=True,
         disabled=not answer_valid,
         key="ncs_practice_submit",
+        on_click=_on_submit_practice,
     )
-    if not submitted:
-        return
-    if not answer_valid:
-        st.error("정답 선택은 필수입니다.")
-        return
-
-    options_dict: Dict[str, str] = dict(practice_item.get("options") or {})
-    correct_key = str(practice_item.get("answer_key") or "")
-    is_correct = bool(selected_key and correct_key and str(selected_key) == correct_key)
-
-    practice_record: Dict[str, Any] = {
-        "question_id": str(practice_item.get("id") or ""),
-        "stimulus_image": "",
-        "options": [f"{k}) {v}" for k, v in options_dict.items()],
-        "selected_option": int(selected_key) - 1 if selected_key else "",
-        "selected_option_text": options_dict.get(str(selected_key), "") if selected_key else "",
-        "selected_option_code": str(selected_key or ""),
-        "correct_idx": int(correct_key) - 1 if correct_key else "",
-        "correct_option_code": correct_key,
-        "is_correct": bool(is_correct),
-        # Rationale selection is removed for NCS tasks.
-        "selected_reason_text": "",
-        "selected_reason_code": "",
-        "timestamp": now_utc_iso(),
-    }
-
-    st.session_state.practice_state = {
-        "attempted": True,
-        "correct": bool(is_correct),
-        "record": practice_record,
-    }
-    st.session_state.payload["practice_attempt"] = practice_record
-
-    try:
-        st.rerun()
-    except Exception:
-        st.experimental_rerun()
 
 
 def render_visual_practice() -> None:
@@ -2750,19 +2669,9 @@ def render_ncs_session(session_id: int, *, next_phase: str) -> None:
     - No per-item feedback.
     """
     scroll_top_js()
-    title_map = {
-        1: "문제 해결 과제 · 세션 1",
-        2: "문제 해결 과제 · 세션 2",
-        3: "문제 해결 과제 · 세션 3",
-    }
-    st.title(title_map.get(int(session_id), "문제 해결 과제"))
+    st.title(NCS_SESSION_LABELS.get(int(session_id), "문제 해결 과제"))
 
-    items_map = {
-        1: NCS_SESSION1_ITEMS,
-        2: NCS_SESSION2_ITEMS,
-        3: NCS_SESSION3_ITEMS,
-    }
-    items = list(items_map.get(int(session_id), []))
+    items = list(NCS_SESSION_ITEMS.get(int(session_id), []))
     rs = st.session_state.round_state
     payload = st.session_state.payload
 
@@ -2892,36 +2801,9 @@ def render_ncs_session(session_id: int, *, next_phase: str) -> None:
     )
 
 
-def render_analysis(round_key: str, round_no: int, next_phase: str) -> None:
-    scroll_top_js()
-    st.session_state.setdefault("mcp_done", {})
-    if not st.session_state["mcp_done"].get(round_no, False):
-        render_mcp_animation(round_key, round_no)
-        st.session_state["mcp_done"][round_no] = True
-        st.session_state["in_mcp"] = False
-        st.session_state["mcp_active_round"] = None
-        st.session_state["mcp_active_round_no"] = None
-        try:
-            st.rerun()
-        except Exception:
-            st.experimental_rerun()
-        return
-
-    st.session_state["in_mcp"] = False
-    st.session_state["mcp_active_round"] = None
-    st.session_state["mcp_active_round_no"] = None
-    st.markdown(ANALYSIS_COMPLETE_CSS, unsafe_allow_html=True)
-
-    round_label_map = {
-        "session1": "문제 해결 과제 · 세션 1",
-        "session2": "문제 해결 과제 · 세션 2",
-    }
-    round_label = round_label_map.get(round_key, "문제 해결 과제")
-    subtitle = "AI 에이전트가 응답 패턴 분석을 마쳤습니다. 아래 버튼을 눌러 피드백을 확인해 주세요."
-    meta_line = f"리포트 준비 완료 · {round_label} 피드백 확인 대기 중"
-    status_line = "맞춤형 요약과 피드백을 전달할 준비가 되었습니다."
-
-    card_open_html = f"""
+# [CHANGE] Static analysis-complete card; only the round label varies. The closing tags
+# are left to the Markdown renderer (a separate "</div>" call was its own empty element).
+ANALYSIS_COMPLETE_CARD_TEMPLATE = """
 <div class="analysis-complete-wrapper">
   <div class="analysis-complete-card">
     <div class="analysis-complete-badge">COVNOX 분석 프로토콜 · {round_label}</div>
@@ -2929,34 +2811,74 @@ def render_analysis(round_key: str, round_no: int, next_phase: str) -> None:
       <div class="analysis-complete-icon">🤖</div>
       <div class="analysis-complete-text">
         <h2 class="analysis-complete-title">분석이 완료되었습니다!</h2>
-        <p class="analysis-complete-subtitle">{subtitle}</p>
+        <p class="analysis-complete-subtitle">AI 에이전트가 응답 패턴 분석을 마쳤습니다. 아래 버튼을 눌러 피드백을 확인해 주세요.</p>
       </div>
     </div>
-    <div class="analysis-complete-meta">{meta_line}</div>
-    <div class="analysis-complete-status">{status_line}</div>
+    <div class="analysis-complete-meta">리포트 준비 완료 · {round_label} 피드백 확인 대기 중</div>
+    <div class="analysis-complete-status">맞춤형 요약과 피드백을 전달할 준비가 되었습니다.</div>
     <div class="analysis-complete-button">
 """
-    card_close_html = """
-    </div>
-  </div>
-</div>
-"""
+
+
+def render_analysis(round_key: str, round_no: int, next_phase: str) -> None:
+    scroll_top_js()
+    st.session_state.setdefault("mcp_done", {})
+    if not st.session_state["mcp_done"].get(round_no, False):
+        # The animation fragment marks the round done and reruns the app when finished.
+        render_mcp_animation(round_key, round_no)
+        return
+
+    st.session_state["in_mcp"] = False
+    st.session_state["mcp_active_round"] = None
+    st.session_state["mcp_active_round_no"] = None
+    st.markdown(ANALYSIS_COMPLETE_CSS, unsafe_allow_html=True)
 
     card_container = st.container()
     with card_container:
-        st.markdown(card_open_html, unsafe_allow_html=True)
+        st.markdown(
+            ANALYSIS_COMPLETE_CARD_TEMPLATE.format(
+                round_label=MCP_ROUND_LABELS.get(round_key, "문제 해결 과제")
+            ),
+            unsafe_allow_html=True,
+        )
         view_button_clicked = st.button(
             "결과 보기",
             key=f"view-results-{round_no}",
             use_container_width=True,
         )
-        st.markdown(card_close_html, unsafe_allow_html=True)
 
     if view_button_clicked:
         st.session_state.analysis_seen[round_key] = True
         set_phase(next_phase)
 
 
+# [CHANGE] Static feedback page markup; render_feedback only fills in the subtitle.
+FEEDBACK_HERO_SUBTITLES: Dict[str, str] = {
+    round_key: f"{label} 리포트" for round_key, label in MCP_ROUND_LABELS.items()
+}
+FEEDBACK_HERO_TEMPLATE = """
+  <div class="feedback-page">
+    <div class="feedback-card feedback-hero-card">
+      <div class="feedback-hero-badge"><span>🤖</span> AI 튜터 칭찬</div>
+      <div class="feedback-hero-body">
+        <div class="feedback-icon-wrap">🧠</div>
+        <div class="feedback-hero-text">
+          <h1 class="feedback-hero-title">분석 완료! 훌륭합니다!</h1>
+          <p class="feedback-hero-subtitle">{hero_subtitle}</p>
+        </div>
+      </div>
+      <div class="feedback-meta">AI 튜터가 응답 패턴을 정밀 분석하고 당신의 응답 내용에 대한 피드백을 정리했습니다.</div>
+    </div>
+    <div class="feedback-card feedback-comment-card">
+      <div class="feedback-comment-title">
+        <span class="feedback-comment-icon">✨</span>
+        AI 튜터의 코멘트
+      </div>
+      <p class="feedback-comment-subtitle">AI 튜터가 분석 결과를 정리했어요. 아래 피드백을 확인해 주세요.</p>
+    </div>
+  """
+
+
 def render_feedback(round_key: str, _reason_labels: List[str], next_phase: str) -> None:
     scroll_top_js()
     st.markdown(FEEDBACK_UI_CSS, unsafe_allow_html=True)
@@ -2982,35 +2904,11 @@ def render_feedback(round_key: str, _reason_labels: List[str], next_phase: str)
     if summary_text and summary_text not in feedback_messages[legacy_key]:
         feedback_messages[legacy_key].append(summary_text)
 
-    hero_subtitle_map = {
-        "session1": "문제 해결 과제 · 세션 1 리포트",
-        "session2": "문제 해결 과제 · 세션 2 리포트",
-    }
-    hero_subtitle = hero_subtitle_map.get(round_key, "문제 해결 과제 피드백")
+    hero_subtitle = FEEDBACK_HERO_SUBTITLES.get(round_key, "문제 해결 과제 피드백")
 
     with st.container():
         st.markdown(
-            f"""
-  <div class="feedback-page">
-    <div class="feedback-card feedback-hero-card">
-      <div class="feedback-hero-badge"><span>🤖</span> AI 튜터 칭찬</div>
-      <div class="feedback-hero-body">
-        <div class="feedback-icon-wrap">🧠</div>
-        <div class="feedback-hero-text">
-          <h1 class="feedback-hero-title">분석 완료! 훌륭합니다!</h1>
-          <p class="feedback-hero-subtitle">{hero_subtitle}</p>
-        </div>
-      </div>
-      <div class="feedback-meta">AI 튜터가 응답 패턴을 정밀 분석하고 당신의 응답 내용에 대한 피드백을 정리했습니다.</div>
-    </div>
-    <div class="feedback-card feedback-comment-card">
-      <div class="feedback-comment-title">
-        <span class="feedback-comment-icon">✨</span>
-        AI 튜터의 코멘트
-      </div>
-      <p class="feedback-comment-subtitle">AI 튜터가 분석 결과를 정리했어요. 아래 피드백을 확인해 주세요.</p>
-    </div>
-  """,
+            FEEDBACK_HERO_TEMPLATE.format(hero_subtitle=hero_subtitle),
             unsafe_allow_html=True,
         )
 
@@ -3022,14 +2920,12 @@ def render_feedback(round_key: str, _reason_labels: List[str], next_phase: str)
             speed=0.01,
         )
 
-        st.markdown('<div class="feedback-actions">', unsafe_allow_html=True)
+        # [CHANGE] Each st.markdown call is its own element, so the old open/close <div>
+        # calls never wrapped the button; they only emitted three empty blocks per rerun.
         if st.button(
             "다음 단계", use_container_width=True, key=f"{round_key}_feedback_next"
         ):
             set_phase(next_phase)
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown("</div>", unsafe_allow_html=True)
 
 
 def render_session3_transition(next_phase: str = "motivation") -> None:
@@ -3063,7 +2959,7 @@ def render_difficulty_check() -> None:
     scroll_top_js()
     st.title("다음 진행할 과제의 난이도를 선택해주세요")
     st.write("다음 라운드에서 진행하기를 원하는 난이도 수준을 선택해 주세요.")
-    likert_options = list(range(1, 11))
+    likert_options = DIFFICULTY_RATING_OPTIONS
     prompt = "다음 라운드 난이도는 방금한 과제에 비해 어느 정도 난이도를 원하시나요? (1=매우 쉬움, 10=매우 어려움)"
     try:
         rating_value = st.radio(
@@ -3131,7 +3027,7 @@ def render_manipulation_check() -> None:
     st.caption(
         "각 문항은 1(전혀 그렇지 않다) ~ 5(매우 그렇다) 사이에서 선택해 주세요. 모든 문항은 필수입니다."
     )
-    st.markdown(LIKERT5_LEGEND_HTML, unsafe_allow_html=True)
+    render_html(LIKERT5_LEGEND_HTML)
 
     total_items = len(MANIPULATION_CHECK_ITEMS)
     per_page = 10
@@ -3146,74 +3042,83 @@ def render_manipulation_check() -> None:
     start_idx = (page - 1) * per_page
     end_idx = min(start_idx + per_page, total_items)
 
-    st.markdown(
-        f"<div style='text-align:center;color:#6b7480;margin-bottom:12px;'>문항 {start_idx + 1}–{end_idx} / {total_items} (페이지 {page}/{total_pages})</div>",
-        unsafe_allow_html=True,
+    render_html(
+        f"<div style='text-align:center;color:#6b7480;margin-bottom:12px;'>문항 {start_idx + 1}–{end_idx} / {total_items} (페이지 {page}/{total_pages})</div>"
     )
 
     answers: Dict[str, int] = st.session_state.setdefault("manip_check", {})
     options = LIKERT5_NUMERIC_OPTIONS
 
-    for offset, item in enumerate(
-        MANIPULATION_CHECK_ITEMS[start_idx:end_idx], start=start_idx + 1
-    ):
-        selection = render_likert_numeric(
-            item_id=item.id,
-            label=f"{offset}. {item.text}",
-            options=options,
-            key_prefix="manip",
-        )
-        value_key = f"manip_val_{item.id}"
-        if selection is None:
-            st.session_state[value_key] = None
-            answers.pop(item.id, None)
-        else:
-            st.session_state[value_key] = int(selection)
-            answers[item.id] = int(selection)
-
-    page_values = [
-        answers.get(item.id) for item in MANIPULATION_CHECK_ITEMS[start_idx:end_idx]
-    ]
-
-    st.divider()
-    col_prev, col_next = st.columns(2)
-    with col_prev:
-        if page > 1 and st.button("← 이전", use_container_width=True, key="manip_prev"):
-            st.session_state.manip_page = page - 1
-            set_phase(st.session_state.phase)
-    with col_next:
-        next_label = "다음 단계" if page == total_pages else "다음 →"
-        if st.button(next_label, use_container_width=True, key="manip_next"):
-            if any(v is None for v in page_values):
-                st.warning("현재 페이지의 모든 문항에 응답해 주세요.")
+    # [CHANGE] Same form batching as render_paginated_likert.
+    with st.form(f"manip_form_{page}", border=False):
+        for offset, item in enumerate(
+            MANIPULATION_CHECK_ITEMS[start_idx:end_idx], start=start_idx + 1
+        ):
+            selection = render_likert_numeric(
+                item_id=item.id,
+                label=f"{offset}. {item.text}",
+                options=options,
+                key_prefix="manip",
+            )
+            value_key = f"manip_val_{item.id}"
+            if selection is None:
+                st.session_state[value_key] = None
+                answers.pop(item.id, None)
             else:
-                if page == total_pages:
-                    complete = all_answered(
-                        answers,
-                        MANIPULATION_CHECK_EXPECTED_COUNT,
-                        valid_options=options,
-                    )
-                    if not complete:
-                        st.warning("모든 문항에 응답해 주세요.")
-                        return
-                    saved = {
-                        item.id: int(answers[item.id])
-                        for item in MANIPULATION_CHECK_ITEMS
-                    }
-                    st.session_state.manip_check_saved = saved
-                    st.session_state.payload["manipulation_check"] = saved
-                    st.session_state.manip_page = 1
-                    set_phase("phone_input")
+                st.session_state[value_key] = int(selection)
+                answers[item.id] = int(selection)
+
+        page_values = [
+            answers.get(item.id) for item in MANIPULATION_CHECK_ITEMS[start_idx:end_idx]
+        ]
+
+        st.divider()
+        col_prev, col_next = st.columns(2)
+        with col_prev:
+            if page > 1 and st.form_submit_button(
+                "← 이전", use_container_width=True
+            ):
+                st.session_state.manip_page = page - 1
+                set_phase(st.session_state.phase)
+        with col_next:
+            next_label = "다음 단계" if page == total_pages else "다음 →"
+            if st.form_submit_button(next_label, use_container_width=True):
+                if None in page_values:
+                    st.warning("현재 페이지의 모든 문항에 응답해 주세요.")
                 else:
-                    st.session_state.manip_page = page + 1
-                    set_phase(st.session_state.phase)
+                    if page == total_pages:
+                        complete = all_answered(
+                            answers,
+                            MANIPULATION_CHECK_EXPECTED_COUNT,
+                            valid_options=options,
+                        )
+                        if not complete:
+                            st.warning("모든 문항에 응답해 주세요.")
+                            return
+                        saved = {
+                            item.id: int(answers[item.id])
+                            for item in MANIPULATION_CHECK_ITEMS
+                        }
+                        st.session_state.manip_check_saved = saved
+                        st.session_state.payload["manipulation_check"] = saved
+                        st.session_state.manip_page = 1
+                        set_phase("phone_input")
+                    else:
+                        st.session_state.manip_page = page + 1
+                        set_phase(st.session_state.phase)
 
 
 def render_post_task_reflection() -> None:
     scroll_top_js()
     st.title("다음 기회에 유사한 과제가 있을 때 어느 정도 난이도에 도전하시겠습니까?")
     st.write("유사한 과제를 더 진행한다면 어느 정도 난이도로 진행하실지 선택해주세요.")
-    likert_options = list(range(1, 11))
+    _render_future_difficulty_rating()
+
+
+# [CHANGE] Fragment, as for the demographic inputs: rating clicks rerun only this block.
+@st.fragment
+def _render_future_difficulty_rating() -> None:
+    likert_options = DIFFICULTY_RATING_OPTIONS
     prompt = "원하는 난이도를 선택해주세요 (1=매우 쉬움, 10=매우 어려움)"
     try:
         rating_value = st.radio(
@@ -3248,9 +3153,12 @@ def render_phone_capture() -> None:
     st.write(
         "답례품(기프티콘) 발송을 위해 휴대폰 번호를 입력해 주세요. 입력하지 않아도 참여는 완료되지만 보상 제공이 어려울 수 있습니다."
     )
-    phone = st.text_input("휴대폰 번호 (예: 010-1234-5678)")
-    st.session_state.payload["phone"] = phone.strip()
-    if st.button("제출하기", use_container_width=True):
+    # [CHANGE] Form: editing the number doesn't rerun the app until it is submitted.
+    with st.form("phone_capture_form", border=False):
+        phone = st.text_input("휴대폰 번호 (예: 010-1234-5678)")
+        submitted = st.form_submit_button("제출하기", use_container_width=True)
+    if submitted:
+        st.session_state.payload["phone"] = phone.strip()
         set_phase("summary")
 
 
@@ -3267,6 +3175,8 @@ def render_summary() -> None:
             condition = normalize_condition(
                 payload.get("feedback_condition", get_or_assign_feedback_condition())
             )
+            # One clock read for every timestamp stamped while building this record.
+            finished_at = now_utc_iso()
             record = ExperimentData(
                 participant_id=payload.get("participant_id")
                 or f"manual_{int(time.time())}",
@@ -3286,7 +3196,7 @@ def render_summary() -> None:
                     {
                         "question_id": q.id,
                         "rating": score,
-                        "timestamp": now_utc_iso(),
+                        "timestamp": finished_at,
                     }
                     for q, score in zip(
                         MOTIVATION_QUESTIONS, payload.get("motivation_responses", [])
@@ -3297,8 +3207,8 @@ def render_summary() -> None:
                     *payload.get("feedback_messages", {}).get("verbs", []),
                 ],
                 timestamps={
-                    "start": payload.get("start_time") or now_utc_iso(),
-                    "end": now_utc_iso(),
+                    "start": payload.get("start_time") or finished_at,
+                    "end": finished_at,
                 },
                 completion_time=sum(
                     d["response_time"] for d in payload.get("inference_details", [])
@@ -3320,12 +3230,21 @@ def render_summary() -> None:
         details = list(payload.get("inference_details", []) or [])
         ncs_items = list(NCS_ITEMS)
 
+        # [CHANGE] Accumulate durations while collecting responses (single pass).
         ncs_responses: List[Dict[str, Any]] = []
+        append_response = ncs_responses.append
+        task_total_duration = 0.0
+        session_duration: Dict[str, float] = {"1": 0.0, "2": 0.0, "3": 0.0}
         for d in details:
             item_id = d.get("item_id") or d.get("question_id")
             if not item_id:
                 continue
-            ncs_responses.append(
+            rt = float(d.get("response_time") or 0.0)
+            task_total_duration += rt
+            sid = str(d.get("session_id") or "")
+            if sid in session_duration:
+                session_duration[sid] += rt
+            append_response(
                 {
                     "item_id": item_id,
                     "session_id": d.get("session_id"),
@@ -3348,14 +3267,6 @@ def render_summary() -> None:
         score, accuracy, per_item_correct, summary = compute_ncs_results(
             ncs_responses, ncs_items
         )
-        task_total_duration = sum(
-            float(r.get("response_time") or 0.0) for r in ncs_responses
-        )
-        session_duration: Dict[str, float] = {"1": 0.0, "2": 0.0, "3": 0.0}
-        for r in ncs_responses:
-            sid = str(r.get("session_id") or "")
-            if sid in session_duration:
-                session_duration[sid] += float(r.get("response_time") or 0.0)
 
         payload["inference_ncs_payload"] = build_ncs_payload(
             responses=ncs_responses,
@@ -3382,9 +3293,11 @@ def render_summary() -> None:
     except Exception:
         pass
 
-    storage_record = build_storage_record(payload, record)
-    sheet_row = build_sheet_row(storage_record)
+    # [CHANGE] Save synchronously (the page reports success/failure and offers a retry),
+    # but only build the record while a save is still pending, not on every rerun.
     if not st.session_state.saved_once and st.session_state.save_error is None:
+        storage_record = build_storage_record(payload, record)
+        sheet_row = build_sheet_row(storage_record)
         try:
             destinations: List[str] = []
             warn_registry: Dict[str, bool] = st.session_state.setdefault(
@@ -3399,10 +3312,8 @@ def render_summary() -> None:
             else:
                 if not google_ready():
                     raise RuntimeError("Google Sheets credentials not configured.")
-                sheet_msg = save_to_sheets(sheet_row)
+                sheet_msg, (gcs_ok, gcs_msg) = save_all(sheet_row, storage_record)
                 destinations.append(sheet_msg)
-
-                gcs_ok, gcs_msg = save_to_gcs(storage_record)
                 if gcs_ok and gcs_msg:
                     destinations.append(gcs_msg)
                 elif gcs_msg:
@@ -3448,6 +3359,8 @@ def render_summary() -> None:
             "응답 저장 중 오류가 발생했습니다. 네트워크를 확인한 뒤 다시 시도해 주세요."
         )
         if st.button("다시 시도", use_container_width=True):
+            # [CHANGE] Re-read secrets/env: a missing config may have been fixed since.
+            reset_config_cache()
             st.session_state.save_error = None
             st.rerun()
     else:
@@ -3489,6 +3402,9 @@ def render_summary() -> None:
             condition_for_scores, {}
         )
         if motivation_scores:
+            # Only the debug view needs pandas; keep it off the import path of every rerun.
+            import pandas as pd
+
             st.subheader("동기 카테고리 평균 점수")
             df = pd.DataFrame(
                 [
@@ -3510,51 +3426,44 @@ def render_summary() -> None:
 
 ensure_session_state()
 
-phase = st.session_state.phase
-if phase == "consent":
-    render_consent()
-elif phase == "demographic":
-    render_demographic()
-elif phase == "instructions":
-    render_instructions()
-elif phase == "anthro":
-    render_anthro()
-elif phase == "achive":
-    render_achive()
-elif phase == "visual_training_intro":
-    render_visual_training_intro()
-elif phase == "practice_building_height":
-    render_practice_building_height()
-elif phase == "visual_practice":
-    render_visual_practice()
-elif phase == "task_intro":
-    render_task_intro()
-elif phase in {"ncs_session1", "inference_nouns"}:
-    render_ncs_session(1, next_phase="analysis_session1")
-elif phase in {"analysis_session1", "analysis_nouns"}:
-    render_analysis("session1", 1, "feedback_session1")
-elif phase in {"feedback_session1", "feedback_nouns"}:
-    render_feedback("session1", [], "ncs_session2")
-elif phase in {"ncs_session2"}:
-    render_ncs_session(2, next_phase="analysis_session2")
-elif phase in {"analysis_session2"}:
-    render_analysis("session2", 2, "feedback_session2")
-elif phase in {"feedback_session2"}:
-    render_feedback("session2", [], "ncs_session3")
-elif phase in {"ncs_session3", "inference_verbs"}:
-    render_ncs_session(3, next_phase="session3_transition")
-elif phase in {"session3_transition", "analysis_verbs", "feedback_verbs"}:
-    render_session3_transition(next_phase="motivation")
-elif phase == "difficulty_check":
+# [CHANGE] Phase routing table, for readability: each phase and its handler (with its
+# arguments) on one line, legacy names aliased explicitly. It is rebuilt on every rerun
+# like the rest of main.py (and must be, since the handlers are redefined each run), so
+# it is not faster than the if/elif ladder it replaces.
+PHASE_HANDLERS: Dict[str, Callable[[], None]] = {
+    "consent": render_consent,
+    "demographic": render_demographic,
+    "instructions": render_instructions,
+    "anthro": render_anthro,
+    "achive": render_achive,
+    "visual_training_intro": render_visual_training_intro,
+    "practice_building_height": render_practice_building_height,
+    "visual_practice": render_visual_practice,
+    "task_intro": render_task_intro,
+    "ncs_session1": partial(render_ncs_session, 1, next_phase="analysis_session1"),
+    "analysis_session1": partial(render_analysis, "session1", 1, "feedback_session1"),
+    "feedback_session1": partial(render_feedback, "session1", [], "ncs_session2"),
+    "ncs_session2": partial(render_ncs_session, 2, next_phase="analysis_session2"),
+    "analysis_session2": partial(render_analysis, "session2", 2, "feedback_session2"),
+    "feedback_session2": partial(render_feedback, "session2", [], "ncs_session3"),
+    "ncs_session3": partial(render_ncs_session, 3, next_phase="session3_transition"),
+    "session3_transition": partial(render_session3_transition, next_phase="motivation"),
     # Backward-compatibility: this phase no longer exists in the new NCS flow.
-    set_phase("ncs_session2")
-elif phase == "motivation":
-    render_motivation()
-elif phase == "post_task_reflection":
-    render_post_task_reflection()
-elif phase == "manipulation_check":
-    render_manipulation_check()
-elif phase == "phone_input":
-    render_phone_capture()
-else:
-    render_summary()
+    "difficulty_check": partial(set_phase, "ncs_session2"),
+    "motivation": render_motivation,
+    "post_task_reflection": render_post_task_reflection,
+    "manipulation_check": render_manipulation_check,
+    "phone_input": render_phone_capture,
+}
+PHASE_HANDLERS.update(
+    {
+        "inference_nouns": PHASE_HANDLERS["ncs_session1"],
+        "analysis_nouns": PHASE_HANDLERS["analysis_session1"],
+        "feedback_nouns": PHASE_HANDLERS["feedback_session1"],
+        "inference_verbs": PHASE_HANDLERS["ncs_session3"],
+        "analysis_verbs": PHASE_HANDLERS["session3_transition"],
+        "feedback_verbs": PHASE_HANDLERS["session3_transition"],
+    }
+)
+
+PHASE_HANDLERS.get(st.session_state.phase, render_summary)()
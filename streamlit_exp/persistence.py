@@ -1,16 +1,37 @@
 # [CHANGE] ASCII-safe persistence helpers for Google Sheets and GCS.
 from __future__ import annotations
 
+import gzip
 import json
 import os
-import uuid
-from dataclasses import asdict, is_dataclass
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import asdict, fields, is_dataclass
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
+import streamlit as st
+
 from constants import MANIPULATION_CHECK_ITEMS
-from utils.google_sheet import append_row_to_sheet
+from utils.google_sheet import append_row_to_sheet, reset_sheet_config, sheet_config
 from utils.persistence import get_cfg, now_utc_iso
 
+try:  # Optional: faster serialization of the sheet JSON cells and the GCS snapshot.
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+# Datetimes and dataclasses go to default=str like under json.dumps, rather than orjson's
+# native ISO/dict encodings. The output still differs from json.dumps in two ways: it is
+# compact ({"a":1}, not {"a": 1}) and non-finite floats (NaN/inf) are written as null
+# instead of NaN/Infinity, so rows written with orjson are formatted differently from
+# older rows and from the stdlib fallback.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
 SCHEMA_VERSION = "2025-11-13.v1"
 
 SANITIZE_MAP: Dict[str, str] = {
@@ -70,7 +91,9 @@ SHEET_COLUMNS: List[str] = [
     "schema_version",
 ]
 
-JSON_COLUMNS = {
+_SHEET_ROW_GETTER = itemgetter(*SHEET_COLUMNS)
+
+JSON_COLUMNS = frozenset({
     "consent_json",
     "consent_flags_json",
     "demographic_json",
@@ -87,11 +110,46 @@ JSON_COLUMNS = {
     "meta_full_json",
     "payload_full_json",
     "experiment_record_full_json",
-}
+})
+
+# Plain-value columns, in sheet order (None is written as a blank cell).
+NON_JSON_COLUMNS: Tuple[str, ...] = tuple(
+    column for column in SHEET_COLUMNS if column not in JSON_COLUMNS
+)
 
-AFFIRMATIVE_VALUES = {"agree", "yes", "y", "true", "1"}
+# Full-object columns whose top-level values include the other JSON columns' objects
+# (meta → inference_summary, payload → inference_details, ...); serialized last so those
+# values can be spliced in from the already-encoded cells instead of being re-encoded.
+_COMPOSITE_JSON_COLUMNS: Tuple[str, ...] = (
+    "meta_full_json",
+    "payload_full_json",
+    "experiment_record_full_json",
+)
+_PART_JSON_COLUMNS: Tuple[str, ...] = tuple(
+    column for column in SHEET_COLUMNS
+    if column in JSON_COLUMNS and column not in _COMPOSITE_JSON_COLUMNS
+)
+
+AFFIRMATIVE_VALUES = frozenset({"agree", "yes", "y", "true", "1"})
+
+# Manipulation-check item ids, read once instead of per save.
+MANIPULATION_CHECK_IDS: Tuple[str, ...] = tuple(item.id for item in MANIPULATION_CHECK_ITEMS)
+_MANIPULATION_CHECK_BLANK: Dict[str, None] = dict.fromkeys(MANIPULATION_CHECK_IDS)
+
+# Every known answer spelling (the raw Korean radio labels, their sanitized values and the
+# affirmative tokens) resolved to its flag once, so these need a single dict hit instead of
+# map → lower() → set lookup; only unknown text falls back to lower().
+_SANITIZED_AFFIRMATIVE: Dict[str, bool] = {
+    **{mapped: mapped.lower() in AFFIRMATIVE_VALUES for mapped in SANITIZE_MAP.values()},
+    **{raw: mapped.lower() in AFFIRMATIVE_VALUES for raw, mapped in SANITIZE_MAP.items()},
+    **dict.fromkeys(AFFIRMATIVE_VALUES, True),
+}
 
 
+# The configuration checks below are memoized, including negative results (False/None/{}).
+# st.secrets reloads when secrets.toml changes and the environment can change too, so the
+# save-retry path calls reset_config_cache() before trying again.
+@lru_cache(maxsize=1)
 def google_ready() -> bool:
     """Return True when remote Google Sheet credentials are available."""
     try:
@@ -114,25 +172,71 @@ def google_ready() -> bool:
     return bool(has_secret_credentials or env_credentials_json or env_credentials_path)
 
 
+# Scalars (and dict key types) json.dumps accepts as-is; bool is covered by int.
+_JSON_SCALAR_TYPES = (str, int, float, type(None))
+
+
+def _is_jsonable(data: Any) -> bool:
+    """Type walk mirroring what json.dumps accepts, without building the string."""
+    if isinstance(data, _JSON_SCALAR_TYPES):
+        return True
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if not isinstance(key, _JSON_SCALAR_TYPES) or not _is_jsonable(value):
+                return False
+        return True
+    if isinstance(data, (list, tuple)):
+        for value in data:
+            if not _is_jsonable(value):
+                return False
+        return True
+    return False
+
+
 def _ensure_jsonable(data: Any) -> Any:
     """
     Ensure the provided data structure can be serialized to JSON.
     Non-serializable values are converted to strings while preserving the structure.
     """
-    try:
-        json.dumps(data, ensure_ascii=False)
+    if _is_jsonable(data):
         return data
-    except (TypeError, ValueError):
-        return json.loads(json.dumps(data, ensure_ascii=False, default=str))
+    if orjson is not None:
+        return orjson.loads(_json_bytes(data))
+    return json.loads(json.dumps(data, ensure_ascii=False, default=str))
+
+
+def _json_bytes(data: Any) -> bytes:
+    """
+    UTF-8 JSON (non-ASCII kept as-is, unknown types via str), using orjson when present.
+    See _ORJSON_OPTIONS for how the orjson output differs from json.dumps.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError, e.g. integers beyond 64 bits
+            pass
+    return json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
 
 
 def _json_or_blank(value: Any) -> str:
     if value is None or value == "":
         return ""
-    try:
-        return json.dumps(value, ensure_ascii=False, default=str)
-    except (TypeError, ValueError):
-        return json.dumps(_ensure_jsonable(value), ensure_ascii=False)
+    return _json_bytes(value).decode("utf-8")
+
+
+def _json_with_parts(value: Any, parts: Dict[int, bytes]) -> str:
+    """Like _json_or_blank, but top-level values found in `parts` (by id) reuse that JSON."""
+    fragment = getattr(orjson, "Fragment", None)  # orjson >= 3.9
+    if fragment is not None and parts and isinstance(value, dict) and value:
+        spliced = {
+            key: fragment(parts[id(item)]) if id(item) in parts else item
+            for key, item in value.items()
+        }
+        try:
+            return orjson.dumps(spliced, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return _json_or_blank(value)
 
 
 def _is_affirmative(value: Any) -> bool:
@@ -141,12 +245,24 @@ def _is_affirmative(value: Any) -> bool:
     if isinstance(value, bool):
         return value
     text = str(value).strip()
-    normalized = SANITIZE_MAP.get(text, text)
-    return normalized.lower() in AFFIRMATIVE_VALUES
+    known = _SANITIZED_AFFIRMATIVE.get(text)
+    if known is not None:
+        return known
+    return text.lower() in AFFIRMATIVE_VALUES
+
+
+# Values written as an empty cell. Kept as a constant: the literal form builds a fresh
+# list, dict and tuple on every call, and the formatters run for a dozen cells per save.
+_BLANK_VALUES: Tuple[Any, ...] = (None, "", [], {})
 
 
 def _format_float(value: Any, precision: int = 3) -> Any:
-    if value in (None, "", [], {}):
+    # Exact-type checks first: meta values are almost always plain floats/ints, and these
+    # skip the blank-value comparisons and the try block.
+    kind = type(value)
+    if kind is float or kind is int:
+        return round(float(value), precision)
+    if value in _BLANK_VALUES:
         return ""
     try:
         return round(float(value), precision)
@@ -155,12 +271,12 @@ def _format_float(value: Any, precision: int = 3) -> Any:
 
 
 def _format_int(value: Any) -> Any:
-    if value in (None, "", [], {}):
+    if type(value) is int:
+        return value
+    if value in _BLANK_VALUES:
         return ""
-    if isinstance(value, bool):
-        return int(value)
     try:
-        return int(value)
+        return int(value)  # bool → 0/1, numeric strings and floats truncated
     except (TypeError, ValueError):
         return value
 
@@ -174,14 +290,31 @@ def _task_specificity(condition: str) -> str:
     return "unknown"
 
 
+# Deletion table for every ASCII character except digits and "+"; str.translate applies it
+# in C. (A dict with __missing__ would drop back into Python for each deleted character.)
+_PHONE_ASCII_STRIP = str.maketrans(
+    "", "", "".join(ch for ch in map(chr, range(128)) if not (ch.isdigit() or ch == "+"))
+)
+
+
 def _safe_phone(phone: str) -> str:
-    return "".join(ch for ch in (phone or "") if ch.isdigit() or ch == "+")
+    text = phone or ""
+    # Fast path: ASCII input (isascii() is an O(1) flag check) goes through the C table.
+    if text.isascii():
+        return text.translate(_PHONE_ASCII_STRIP)
+    return "".join(ch for ch in text if ch.isdigit() or ch == "+")
 
 
 def _experiment_record_to_dict(record: Any) -> Dict[str, Any]:
     if record is None:
         return {}
-    if is_dataclass(record):
+    if is_dataclass(record) and not isinstance(record, type):
+        # asdict() deep-copies every nested list/dict. ExperimentData holds plain containers
+        # that are only serialized from here, so a shallow field map is enough unless a
+        # field is itself a dataclass.
+        shallow = {field.name: getattr(record, field.name) for field in fields(record)}
+        if not any(is_dataclass(value) for value in shallow.values()):
+            return shallow
         try:
             return asdict(record)
         except TypeError:
@@ -199,22 +332,25 @@ def _experiment_record_to_dict(record: Any) -> Dict[str, Any]:
 
 def build_storage_record(payload: Dict[str, Any], record: Any) -> Dict[str, Any]:
     """Build a JSON-serializable record that captures all participant responses."""
+    # Top-level copy only: this becomes the stored payload snapshot. The sections below are
+    # only read (the merge into manipulation_complete builds a new dict), so no per-section copies.
     payload = dict(payload or {})
 
-    consent = dict(payload.get("consent", {}) or {})
-    demographic = dict(payload.get("demographic", {}) or {})
-    anthro_responses = list(payload.get("anthro_responses", []) or [])
-    achive_responses = list(payload.get("achive_responses", []) or [])
-    motivation_responses = list(payload.get("motivation_responses", []) or [])
-    motivation_scores = dict(payload.get("motivation_category_scores", {}) or {})
-    difficulty_checks = dict(payload.get("difficulty_checks", {}) or {})
-    manipulation_check = dict(payload.get("manipulation_check", {}) or {})
-    inference_details = list(payload.get("inference_details", []) or [])
-    feedback_messages = dict(payload.get("feedback_messages", {}) or {})
-    open_feedback = (payload.get("open_feedback") or "").strip()
+    consent = payload.get("consent") or {}
+    anthro_responses = payload.get("anthro_responses") or []
+    achive_responses = payload.get("achive_responses") or []
+    motivation_responses = payload.get("motivation_responses") or []
+    difficulty_checks = payload.get("difficulty_checks") or {}
+    manipulation_check = payload.get("manipulation_check") or {}
+    inference_details = payload.get("inference_details") or []
     phone_raw = payload.get("phone") or ""
+    phone_number = _safe_phone(phone_raw)
 
-    record_timestamps = getattr(record, "timestamps", {}) if record else {}
+    # One field snapshot of the experiment record serves both the lookups below and the
+    # experiment_record section, instead of a getattr() per use.
+    record_fields = _experiment_record_to_dict(record)
+    record_condition = record_fields.get("condition") or ""
+    record_timestamps = record_fields.get("timestamps") or {}
     start_iso = payload.get("start_time") or record_timestamps.get("start")
     end_iso = payload.get("end_time") or record_timestamps.get("end")
     saved_at = now_utc_iso()
@@ -222,8 +358,7 @@ def build_storage_record(payload: Dict[str, Any], record: Any) -> Dict[str, Any]
     condition_value = (
         payload.get("praise_condition")
         or payload.get("feedback_condition")
-        or getattr(record, "condition", "")
-        or ""
+        or record_condition
     )
     specificity = _task_specificity(str(condition_value))
     phase_order = payload.get("phase_order") or "nouns_then_verbs"
@@ -231,59 +366,62 @@ def build_storage_record(payload: Dict[str, Any], record: Any) -> Dict[str, Any]
     total_questions = len(inference_details)
     correct_count = 0
     total_response_time = 0.0
-    per_round: Dict[str, Dict[str, Any]] = {}
+    # Per-round tallies as [questions, correct, total_time]; the summary dicts are built
+    # once at the end instead of being updated by key for every detail.
+    per_round: Dict[str, List[Any]] = {}
     for detail in inference_details:
-        round_key = str(detail.get("round") or "unknown")
-        summary = per_round.setdefault(
-            round_key,
-            {"round": round_key, "questions": 0, "correct": 0, "total_time": 0.0},
-        )
-        summary["questions"] += 1
-        if detail.get("selected_option") == detail.get("correct_idx"):
+        get = detail.get
+        round_key = str(get("round") or "unknown")
+        tally = per_round.get(round_key)
+        if tally is None:
+            tally = per_round[round_key] = [0, 0, 0.0]
+        tally[0] += 1
+        if get("selected_option") == get("correct_idx"):
             correct_count += 1
-            summary["correct"] += 1
-        try:
-            response_time = float(detail.get("response_time") or 0.0)
-        except (TypeError, ValueError):
-            response_time = 0.0
-        summary["total_time"] += response_time
+            tally[1] += 1
+        response_time = get("response_time")
+        if type(response_time) is not float:  # recorded as float; coerce anything else
+            try:
+                response_time = float(response_time or 0.0)
+            except (TypeError, ValueError):
+                response_time = 0.0
+        tally[2] += response_time
         total_response_time += response_time
 
-    for summary in per_round.values():
-        questions = summary["questions"]
-        if questions:
-            summary["accuracy_pct"] = round(summary["correct"] / questions, 4)
-            summary["avg_response_time"] = round(summary["total_time"] / questions, 3)
-        else:
-            summary["accuracy_pct"] = None
-            summary["avg_response_time"] = None
-
-    per_round_summary = sorted(
-        per_round.values(),
-        key=lambda entry: entry.get("round", ""),
-    )
+    per_round_summary: List[Dict[str, Any]] = []
+    for round_key in sorted(per_round):
+        questions, correct, total_time = per_round[round_key]  # questions >= 1
+        per_round_summary.append(
+            {
+                "round": round_key,
+                "questions": questions,
+                "correct": correct,
+                "total_time": total_time,
+                "accuracy_pct": round(correct / questions, 4),
+                "avg_response_time": round(total_time / questions, 3),
+            }
+        )
 
     accuracy_pct = round(correct_count / total_questions, 4) if total_questions else None
-    completion_seconds = getattr(record, "completion_time", None)
+    completion_seconds = record_fields.get("completion_time")
     if completion_seconds is None and total_response_time:
         completion_seconds = round(total_response_time, 3)
 
     payload_snapshot = _ensure_jsonable(payload)
-    experiment_record = _ensure_jsonable(_experiment_record_to_dict(record))
+    experiment_record = _ensure_jsonable(record_fields)
 
     consent_flags = {
         "research": _is_affirmative(consent.get("consent_research")),
         "privacy": _is_affirmative(consent.get("consent_privacy")),
     }
 
-    manipulation_complete = dict(manipulation_check)
-    for item in MANIPULATION_CHECK_ITEMS:
-        manipulation_complete.setdefault(item.id, manipulation_check.get(item.id))
+    # Every item id (unanswered → None), overlaid with the answers in one C-level merge.
+    manipulation_complete = _MANIPULATION_CHECK_BLANK | manipulation_check
 
     meta: Dict[str, Any] = {
         "saved_at": saved_at,
         "participant_id": payload.get("participant_id")
-        or getattr(record, "participant_id", "")
+        or record_fields.get("participant_id")
         or "",
         "condition": condition_value,
         "condition_specificity": specificity,
@@ -297,19 +435,15 @@ def build_storage_record(payload: Dict[str, Any], record: Any) -> Dict[str, Any]
         "total_inference_questions": total_questions,
         "inference_correct_count": correct_count,
         "inference_accuracy_pct": accuracy_pct,
-        "anthro_count": len([v for v in anthro_responses if v is not None]),
-        "achive_count": len([v for v in achive_responses if v is not None]),
-        "motivation_count": len([v for v in motivation_responses if v is not None]),
+        "anthro_count": len(anthro_responses) - anthro_responses.count(None),
+        "achive_count": len(achive_responses) - achive_responses.count(None),
+        "motivation_count": len(motivation_responses) - motivation_responses.count(None),
         "difficulty_checks_count": len(difficulty_checks),
-        "phone_number": _safe_phone(phone_raw),
+        "phone_number": phone_number,
         "phone_number_raw": phone_raw,
-        "contact_provided": bool(_safe_phone(phone_raw)),
-        "praise_condition": payload.get("praise_condition")
-        or getattr(record, "condition", "")
-        or "",
-        "feedback_condition": payload.get("feedback_condition")
-        or getattr(record, "condition", "")
-        or "",
+        "contact_provided": bool(phone_number),
+        "praise_condition": payload.get("praise_condition") or record_condition,
+        "feedback_condition": payload.get("feedback_condition") or record_condition,
         "consent_flags": consent_flags,
         "manipulation_check_full": manipulation_complete,
         "inference_summary": {
@@ -411,7 +545,7 @@ def build_sheet_row(storage_record: Dict[str, Any]) -> List[Any]:
         if meta_value not in (None, ""):
             return meta_value
         if isinstance(responses, list):
-            return len([val for val in responses if val is not None])
+            return len(responses) - responses.count(None)
         if isinstance(responses, dict):
             return len(responses)
         return ""
@@ -463,15 +597,27 @@ def build_sheet_row(storage_record: Dict[str, Any]) -> List[Any]:
         "schema_version": schema_version,
     }
 
-    for column in JSON_COLUMNS:
-        row_map[column] = _json_or_blank(row_map.get(column))
+    # Encode each part once; the composite columns embed those bytes rather than
+    # walking the same (largest) sub-objects a second time.
+    encoded_parts: Dict[int, bytes] = {}
+    for column in _PART_JSON_COLUMNS:
+        value = row_map[column]
+        if value is None or value == "":
+            row_map[column] = ""
+            continue
+        encoded = _json_bytes(value)
+        encoded_parts[id(value)] = encoded
+        row_map[column] = encoded.decode("utf-8")
+    for column in _COMPOSITE_JSON_COLUMNS:
+        row_map[column] = _json_with_parts(row_map[column], encoded_parts)
 
     # Ensure primitives or blank strings for non-JSON columns.
-    for key in set(SHEET_COLUMNS) - JSON_COLUMNS:
-        if row_map.get(key) is None:
+    for key in NON_JSON_COLUMNS:
+        if row_map[key] is None:
             row_map[key] = ""
 
-    return [row_map.get(column, "") for column in SHEET_COLUMNS]
+    # row_map defines every SHEET_COLUMNS key, so one C-level itemgetter call orders the row.
+    return list(_SHEET_ROW_GETTER(row_map))
 
 
 def save_to_sheets(row: List[Any], worksheet: Optional[str] = None) -> str:
@@ -483,11 +629,7 @@ def save_to_sheets(row: List[Any], worksheet: Optional[str] = None) -> str:
             f"Sheet row length {len(row)} does not match expected {len(SHEET_COLUMNS)} columns."
         )
 
-    try:
-        config = get_cfg()
-    except RuntimeError:
-        config = {}
-
+    config = sheet_config()
     worksheet_name = (
         worksheet
         or config.get("worksheet_name")
@@ -499,6 +641,9 @@ def save_to_sheets(row: List[Any], worksheet: Optional[str] = None) -> str:
     return f"sheets:{worksheet_name}"
 
 
+# Built once per process (credential parsing, auth session and connection pool) and
+# shared by every upload; a failed construction raises and is not cached.
+@st.cache_resource(max_entries=1, show_spinner=False)
 def _storage_client():
     try:
         from google.cloud import storage
@@ -527,17 +672,64 @@ def _storage_client():
     return storage.Client()
 
 
-def save_to_gcs(storage_record: Dict[str, Any]) -> Tuple[bool, str]:
-    """Upload normalized record JSON to GCS if configured."""
+# Snapshot sections that build_sheet_row also encodes whole, with their row positions.
+_SNAPSHOT_ROW_CELLS: Tuple[Tuple[str, int], ...] = (
+    ("meta", SHEET_COLUMNS.index("meta_full_json")),
+    ("payload", SHEET_COLUMNS.index("payload_full_json")),
+    ("experiment_record", SHEET_COLUMNS.index("experiment_record_full_json")),
+)
+
+
+def _snapshot_bytes(
+    storage_record: Dict[str, Any], sheet_row: Optional[List[Any]] = None
+) -> bytes:
+    """Encode the GCS snapshot, splicing in the row's already-encoded sections when given."""
+    fragment = getattr(orjson, "Fragment", None)  # orjson >= 3.9
+    if fragment is not None and sheet_row is not None:
+        spliced = dict(storage_record)
+        for key, index in _SNAPSHOT_ROW_CELLS:
+            cell = sheet_row[index]
+            if cell and isinstance(spliced.get(key), dict):
+                spliced[key] = fragment(cell)
+        try:
+            return orjson.dumps(spliced, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return _json_bytes(storage_record)
+
+
+def _resolve_gcs_target() -> Tuple[Optional[Any], str]:
+    """Return (client, bucket_name), or (None, reason) when GCS is not usable."""
     bucket_name = get_gcs_bucket_name()
     if not bucket_name:
-        return False, "GCS bucket not configured"
-
+        return None, "GCS bucket not configured"
     try:
         client = _storage_client()
     except Exception as exc:  # pragma: no cover - runtime dependent
-        return False, f"GCS client unavailable: {exc}"
+        return None, f"GCS client unavailable: {exc}"
+    return client, bucket_name
 
+
+def save_to_gcs(
+    storage_record: Dict[str, Any], sheet_row: Optional[List[Any]] = None
+) -> Tuple[bool, str]:
+    """
+    Upload normalized record JSON to GCS if configured.
+    Pass the sheet row built from the same record to reuse its encoded JSON sections.
+    """
+    client, target = _resolve_gcs_target()
+    if client is None:
+        return False, target
+    return _upload_snapshot(client, target, storage_record, sheet_row)
+
+
+def _upload_snapshot(
+    client: Any,
+    bucket_name: str,
+    storage_record: Dict[str, Any],
+    sheet_row: Optional[List[Any]] = None,
+) -> Tuple[bool, str]:
+    """Upload the snapshot with an already-resolved client (no st.* / secrets access)."""
     meta = storage_record.get("meta") or {}
     participant_source = (
         meta.get("participant_id")
@@ -555,12 +747,15 @@ def save_to_gcs(storage_record: Dict[str, Any]) -> Tuple[bool, str]:
         or now_utc_iso()
     )
     safe_timestamp = str(finished_at).replace(":", "-")
-    blob_name = f"participants/{participant_id}_{safe_timestamp}_{uuid.uuid4().hex[:8]}.json"
+    blob_name = f"participants/{participant_id}_{safe_timestamp}_{os.urandom(4).hex()}.json"
     try:
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(blob_name)
+        # Stored gzip-encoded (the repeated keys compress well); GCS transcodes it back to
+        # plain JSON for clients that do not accept gzip.
+        blob.content_encoding = "gzip"
         blob.upload_from_string(
-            json.dumps(storage_record, ensure_ascii=False, default=str),
+            gzip.compress(_snapshot_bytes(storage_record, sheet_row), compresslevel=3),
             content_type="application/json",
         )
     except Exception as exc:  # pragma: no cover - runtime dependent
@@ -568,6 +763,51 @@ def save_to_gcs(storage_record: Dict[str, Any]) -> Tuple[bool, str]:
     return True, f"gcs:{bucket_name}/{blob_name}"
 
 
+# The GCS snapshot and the Sheets append hit independent backends; the upload runs here
+# while the append runs on the caller's thread. Each save submits a single task and waits
+# for it, but the pool is shared by every session in the process: 4 workers let a few
+# participants finishing at the same time upload without queuing behind each other.
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gcs-upload")
+
+# Session-state key holding a successful snapshot upload, so a retry after a failed
+# Sheets append does not upload the same participant's snapshot again.
+GCS_RESULT_STATE_KEY = "gcs_snapshot_result"
+
+
+def save_all(
+    row: List[Any], storage_record: Dict[str, Any], worksheet: Optional[str] = None
+) -> Tuple[str, Tuple[bool, str]]:
+    """
+    Append the sheet row and upload the GCS snapshot concurrently, waiting for both.
+    Sheets errors propagate unchanged; the GCS outcome is returned as in save_to_gcs.
+
+    A successful upload is kept in st.session_state and reused on later calls (retries).
+    Config, secrets and the cached storage client are resolved here on the script thread;
+    the pool thread only performs the upload.
+    """
+    uploaded = st.session_state.get(GCS_RESULT_STATE_KEY)
+    if uploaded:
+        return save_to_sheets(row, worksheet=worksheet), uploaded
+
+    client, target = _resolve_gcs_target()
+    if client is None:
+        return save_to_sheets(row, worksheet=worksheet), (False, target)
+
+    gcs_future = _UPLOAD_POOL.submit(_upload_snapshot, client, target, storage_record, row)
+    try:
+        sheet_msg = save_to_sheets(row, worksheet=worksheet)
+    finally:
+        wait((gcs_future,))
+        try:
+            gcs_result = gcs_future.result()
+        except Exception as exc:  # pragma: no cover - runtime dependent
+            gcs_result = (False, f"GCS upload failed: {exc}")
+        if gcs_result[0]:
+            st.session_state[GCS_RESULT_STATE_KEY] = gcs_result
+    return sheet_msg, gcs_result
+
+
+@lru_cache(maxsize=1)
 def get_gcs_bucket_name() -> Optional[str]:
     try:
         cfg = get_cfg()
@@ -578,3 +818,10 @@ def get_gcs_bucket_name() -> Optional[str]:
         return str(bucket)
     env_bucket = os.getenv("GCS_BUCKET")
     return env_bucket or None
+
+
+def reset_config_cache() -> None:
+    """Forget the memoized configuration lookups (e.g. after editing secrets or env)."""
+    google_ready.cache_clear()
+    get_gcs_bucket_name.cache_clear()
+    reset_sheet_config()
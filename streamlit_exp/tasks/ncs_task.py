@@ -49,6 +49,14 @@ _PLACEHOLDER_SUBSTRINGS: Tuple[str, ...] = (
 )
 
 
+# Option display patterns, compiled once at import instead of on every item render.
+_ALLOCATION_TOKEN_RE = re.compile(r"([A-G])\s*([0-9]+)")
+_SCHEDULE_OPTION_RE = re.compile(
+    r"^\s*(오전|오후)\s*/\s*회의실\s*([A-Z])\s*/\s*([A-E](?:\s*,\s*[A-E])*)\s*참석\s*$"
+)
+_TRAILING_NOTE_RE = re.compile(r"\(([^)]*)\)\s*$")
+
+
 def _is_dev_mode() -> bool:
     """
     Dev-only logging for stimulus QA.
@@ -515,6 +523,38 @@ def load_ncs_items() -> List[Dict[str, Any]]:
     return items
 
 
+# Very easy NCS-style practice item (short; similar length to main items).
+# Built once at import; callers must treat it as read-only.
+NCS_PRACTICE_ITEM: Dict[str, Any] = {
+    "id": "ncs_practice_q1",
+    "item_number": 0,
+    "session_id": 0,
+    "domain": "practice",
+    "instruction": "사수가 자리를 비워 혼자 업무를 보던 중, 메일 한 통이 도착했다.\n 받은 메일 제목: [!긴급!] A시스템에 심각한 오류가 발견되었습니다. 확인 후 회신 바랍니다.",
+    "stimulus_type": "text",
+    "stimulus_text": "",
+    "info_blocks": [
+        {
+            "title": "",
+            "bullets": [
+                "모든 메시지의 연락은 사수의 컨펌을 받은 후 회신 해야한다.",
+                " 단, 사수 부재시 개별 판단이 가능하다.",
+            ],
+        }
+    ],
+    "table_spec": {},
+    "question": "다음 중 가장 적절한 행동은 무엇인가?",
+    "options": {
+        "1": "즉시 메일에 답장한다.",
+        "2": "사수에게 보고하고 후속 조치를 기다린다.",
+        "3": "사수에게 해당 메일을 포워딩한다.",
+        "4": "내용 확인 후 대기한다.",
+        "5": "시스템 문제를 내가 해결한다.",
+    },
+    "answer_key": "1",
+}
+
+
 def render_ncs_item(
     item: Dict[str, Any], item_index: int, total_items: int
 ) -> Tuple[Optional[str], List[str], Dict[str, Any]]:
@@ -554,7 +594,11 @@ def render_ncs_item(
             unsafe_allow_html=True,
         )
 
-    def _render_small_table(columns: List[Any], rows: List[Any], *, caption: str = "") -> None:
+    def _stimulus_part(fragment: str) -> str:
+        # Pieces that used to be separate elements keep Streamlit's inter-element gap via CSS.
+        return f'<div class="task-stimulus-part">{fragment}</div>'
+
+    def _small_table_html(columns: List[Any], rows: List[Any], *, caption: str = "") -> str:
         safe_cols = [_escape(c) for c in list(columns or [])]
         safe_rows: List[List[str]] = []
         for r in list(rows or []):
@@ -567,13 +611,11 @@ def render_ncs_item(
 
         caption_html = f"<div class='task-table-caption'>{_escape(caption)}</div>" if caption else ""
         head_html = "".join([f"<th>{c}</th>" for c in safe_cols]) if safe_cols else ""
-        body_html = ""
-        for rr in safe_rows:
-            tds = "".join([f"<td>{c}</td>" for c in rr])
-            body_html += f"<tr>{tds}</tr>"
+        body_html = "".join(
+            ["<tr><td>" + "</td><td>".join(rr) + "</td></tr>" if rr else "<tr></tr>" for rr in safe_rows]
+        )
 
-        st.markdown(
-            f"""
+        return f"""
 {caption_html}
 <div class="task-table-wrap">
   <table class="task-table">
@@ -583,11 +625,9 @@ def render_ncs_item(
     </tbody>
   </table>
 </div>
-""",
-            unsafe_allow_html=True,
-        )
+"""
 
-    def _render_info_block(block: Dict[str, Any]) -> None:
+    def _info_block_html(block: Dict[str, Any]) -> str:
         title = str(block.get("title") or "").strip()
         text = str(block.get("text") or "").strip()
         bullets = list(block.get("bullets") or [])
@@ -601,24 +641,23 @@ def render_ncs_item(
             body_parts.append(f'<ul class="task-bullets">{items_html}</ul>')
 
         title_html = f'<div class="task-block-title">{_escape(title)}</div>' if title else ""
-        st.markdown(
-            f"""
+        block_html = _stimulus_part(f"""
 <div class="task-block">
   {title_html}
   <div class="task-block-body">
     {''.join(body_parts) if body_parts else ''}
   </div>
 </div>
-""",
-            unsafe_allow_html=True,
-        )
-
+""")
         if table:
-            _render_small_table(
-                list(table.get("columns") or []),
-                list(table.get("rows") or []),
-                caption=str(table.get("caption") or ""),
+            block_html += _stimulus_part(
+                _small_table_html(
+                    list(table.get("columns") or []),
+                    list(table.get("rows") or []),
+                    caption=str(table.get("caption") or ""),
+                )
             )
+        return block_html
 
     # Instruction (card)
     instruction = str(item.get("instruction", "") or "").strip()
@@ -629,21 +668,24 @@ def render_ncs_item(
     stimulus_text = str(item.get("stimulus_text", "") or "")
     info_blocks: List[Dict[str, Any]] = list(item.get("info_blocks") or [])
 
-    # Conditions (structured blocks)
+    # Conditions (structured blocks), emitted as one element rather than one per block/table.
+    stimulus_parts: List[str] = []
     if info_blocks or stimulus_text:
         for blk in info_blocks:
             if isinstance(blk, dict):
-                _render_info_block(blk)
+                stimulus_parts.append(_info_block_html(blk))
 
         # Legacy fallback: render remaining stimulus text only when it's short.
         # (Avoid dense paragraphs; prefer authoring via info_blocks.)
         if stimulus_text and not info_blocks:
             lines = [ln.strip() for ln in stimulus_text.splitlines() if ln.strip()]
             if len(lines) <= 3:
-                _render_info_block({"title": "Information", "bullets": lines})
+                stimulus_parts.append(_info_block_html({"title": "Information", "bullets": lines}))
             else:
-                _render_info_block(
-                    {"title": "Information", "bullets": lines[:8] + (["(… 생략 …)"] if len(lines) > 8 else [])}
+                stimulus_parts.append(
+                    _info_block_html(
+                        {"title": "Information", "bullets": lines[:8] + (["(… 생략 …)"] if len(lines) > 8 else [])}
+                    )
                 )
 
     if stimulus_type in {"table", "table+chart"}:
@@ -651,8 +693,11 @@ def render_ncs_item(
         columns = list(spec.get("columns") or [])
         rows = list(spec.get("rows") or [])
         if columns and rows:
-            st.markdown('<div class="task-section-title">자료 (표)</div>', unsafe_allow_html=True)
-            _render_small_table(columns, rows)
+            stimulus_parts.append(_stimulus_part('<div class="task-section-title">자료 (표)</div>'))
+            stimulus_parts.append(_stimulus_part(_small_table_html(columns, rows)))
+
+    if stimulus_parts:
+        st.markdown("".join(stimulus_parts), unsafe_allow_html=True)
 
     if stimulus_type in {"chart", "table+chart"}:
         spec = dict(item.get("chart_spec") or {})
@@ -685,9 +730,6 @@ def render_ncs_item(
     options: Dict[str, str] = dict(item.get("options") or {})
     option_keys = list(options.keys())
 
-    _allocation_token_re = re.compile(r"([A-G])\s*([0-9]+)")
-    _schedule_option_re = re.compile(r"^\s*(오전|오후)\s*/\s*회의실\s*([A-Z])\s*/\s*([A-E](?:\s*,\s*[A-E])*)\s*참석\s*$")
-
     def _format_option_value_for_display(raw: str) -> str:
         """
         Improve readability of long/structured options without changing content.
@@ -701,7 +743,7 @@ def render_ncs_item(
             return text
 
         # Meeting schedule option (e.g., Session 2 item 6): add line breaks + labels.
-        m = _schedule_option_re.match(text)
+        m = _SCHEDULE_OPTION_RE.match(text)
         if m:
             time_of_day = m.group(1)
             room = m.group(2)
@@ -715,11 +757,11 @@ def render_ncs_item(
             )
 
         # Allocation-style option (e.g., Session 2 item 10).
-        tokens = _allocation_token_re.findall(text)
+        tokens = _ALLOCATION_TOKEN_RE.findall(text)
         token_map = {k: v for k, v in tokens}
         if len(tokens) >= 5 and {"A", "B", "C"}.issubset(set(token_map.keys())):
             tail_note = ""
-            m = re.search(r"\(([^)]*)\)\s*$", text)
+            m = _TRAILING_NOTE_RE.search(text)
             if m:
                 tail_note = m.group(1).strip()
 
@@ -760,16 +802,19 @@ def render_ncs_item(
         st.session_state.get("ncs_inputs_disabled", False)
     )
 
+    # Format each option label once; the radio calls format_func per option per render.
+    option_labels: Dict[str, str] = {}
+    for k in option_keys:
+        display = _format_option_value_for_display(options.get(str(k), ""))
+        sep = "\n" if "\n" in display else " "
+        option_labels[k] = f"{k}){sep}{display}"
+
     selected_key = st.radio(
         "선택지",
         options=option_keys,
         index=None,
         label_visibility="collapsed",
-        format_func=lambda k: (
-            f"{k})\n{_format_option_value_for_display(options.get(str(k), ''))}"
-            if "\n" in _format_option_value_for_display(options.get(str(k), ""))
-            else f"{k}) {_format_option_value_for_display(options.get(str(k), ''))}"
-        ),
+        format_func=option_labels.__getitem__,
         key=f"{ss_prefix}_answer",
         disabled=inputs_disabled,
     )
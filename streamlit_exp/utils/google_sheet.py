@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
+import streamlit as st
 from google.oauth2.service_account import Credentials
 from gspread.utils import rowcol_to_a1
 
@@ -33,6 +35,9 @@ def _service_account_info() -> Optional[Dict[str, Any]]:
     return None
 
 
+# Authorized once per process and reused across saves (google-auth refreshes the token);
+# a failed authorization raises and is not cached.
+@st.cache_resource(max_entries=1, show_spinner=False)
 def _client() -> gspread.Client:
     info = _service_account_info()
     if not info:
@@ -49,7 +54,7 @@ def _client() -> gspread.Client:
 
 def get_google_sheet():
     client = _client()
-    gs_conf = _sheet_config()
+    gs_conf = sheet_config()
     sheet_id = gs_conf.get("spreadsheet_id") or os.getenv("GOOGLE_SHEET_ID")
     sheet_url = gs_conf.get("spreadsheet_url") or os.getenv("GOOGLE_SHEET_URL")
     if sheet_id:
@@ -62,12 +67,38 @@ def get_google_sheet():
 def append_row_to_sheet(
     row: List[Any], worksheet: str = "resp", header: Optional[List[Any]] = None
 ) -> None:
+    append_rows_to_sheet([row], worksheet=worksheet, header=header)
+
+
+def append_rows_to_sheet(
+    rows: List[List[Any]], worksheet: str = "resp", header: Optional[List[Any]] = None
+) -> None:
+    """Append several rows with a single Sheets API write."""
+    if not rows:
+        return
+    widest = max(len(row) for row in rows)
+    ws = _prepared_worksheet(worksheet, tuple(header) if header else None, widest)
+    try:
+        ws.append_rows(rows, value_input_option="RAW")
+    except gspread.exceptions.APIError:
+        # The sheet may have been renamed/deleted or re-headed; re-open on the next save.
+        _prepared_worksheet.clear()
+        raise
+
+
+# Opening the spreadsheet, looking up the worksheet and verifying the header cost several
+# API round-trips; do them once per (worksheet, header) per process instead of per save.
+# `_widest` only sizes a newly created worksheet and is deliberately not part of the key.
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _prepared_worksheet(
+    worksheet: str, header: Optional[Tuple[Any, ...]], _widest: int
+) -> gspread.Worksheet:
     sh = get_google_sheet()
     try:
         ws = sh.worksheet(worksheet)
     except gspread.exceptions.WorksheetNotFound:
-        target_cols = len(header) if header else max(1, len(row))
-        target_rows = max(2, len(row) + 1)
+        target_cols = len(header) if header else max(1, _widest)
+        target_rows = max(2, _widest + 1)
         ws = sh.add_worksheet(title=worksheet, rows=target_rows, cols=target_cols)
     if header:
         expected_cols = len(header)
@@ -78,11 +109,18 @@ def append_row_to_sheet(
         if normalized_existing[:expected_cols] != list(header):
             header_range = f"A1:{rowcol_to_a1(1, expected_cols)}"
             ws.update(header_range, [list(header)])
-    ws.append_row(row, value_input_option="RAW")
+    return ws
 
 
-def _sheet_config() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def sheet_config() -> Dict[str, Any]:
+    """Persistence config (empty when secrets are missing), memoized; treat as read-only."""
     try:
         return get_cfg()
     except RuntimeError:
         return {}
+
+
+def reset_sheet_config() -> None:
+    """Forget the memoized config so the next sheet_config() call re-reads secrets/env."""
+    sheet_config.cache_clear()
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import hashlib
 import re
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import streamlit as st
 
@@ -25,6 +25,21 @@ def _sanitize_key(raw: str) -> str:
     return cleaned
 
 
+def render_html(fragment: str, *, container: Optional[Any] = None) -> None:
+    """
+    Render a static HTML fragment, bypassing the Markdown pipeline when `st.html` exists.
+
+    Only use this for self-contained markup (no <script>/<style>, no tags left open for
+    a later call to close); anything else must keep going through `st.markdown`.
+    """
+    target = container if container is not None else st
+    html_fn = getattr(target, "html", None)
+    if html_fn is not None:
+        html_fn(fragment)
+    else:
+        target.markdown(fragment, unsafe_allow_html=True)
+
+
 def render_likert_numeric(
     item_id: str,
     label: str,
@@ -38,13 +53,18 @@ def render_likert_numeric(
 
     Returns the selected integer (1..5 by default) or None when unanswered.
     """
-    option_list: List[int] = list(options) if options is not None else LIKERT5_NUMERIC_OPTIONS
+    if options is None:
+        option_list: List[int] = LIKERT5_NUMERIC_OPTIONS
+    elif isinstance(options, list):
+        option_list = options
+    else:
+        option_list = list(options)
     safe_key = _sanitize_key(f"{key_prefix}_{item_id}")
     selection = st.radio(
         label,
         option_list,
         index=None,
-        format_func=lambda value: f"{value}",
+        format_func=str,
         horizontal=horizontal,
         key=safe_key,
     )